@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2024 Colour Developers"
 __license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
@@ -16,20 +18,101 @@ __version__ = f"{__major_version__}.{__minor_version__}.{__change_version__}"
 __all__ = [
     "cxf3",
     "read_cxf_from_file",
+    "read_cxf_many",
     "read_cxf",
     "write_cxf",
+    "write_cxf_to_file",
 ]
 
-from io import BytesIO
-from os import PathLike
+import importlib
+import io
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import lru_cache, partial
+from importlib.resources import files
+from typing import TYPE_CHECKING, BinaryIO, cast
 
 from lxml import etree
-from xsdata.exceptions import ParserError
+from xsdata.exceptions import ConverterError, ParserError
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers import XmlParser
-from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+
+from colour_cxf._serialize import CxFSerializer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from os import PathLike
+
+    from typing_extensions import Buffer
+
+    import colour_cxf.cxf3
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the generated :mod:`colour_cxf.cxf3` package on first access.
+
+    Importing the generated data classes and building their binding context
+    are deferred until a document is read or written.
+    """
+
+    if name == "cxf3":
+        return importlib.import_module("colour_cxf.cxf3")
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@lru_cache(maxsize=1)
+def _get_context() -> XmlContext:
+    """
+    Return the *xsdata* context shared by the parser and the serializer.
+
+    The binding metadata of the :mod:`colour_cxf.cxf3` data classes is built
+    once and cached.
+
+    Returns
+    -------
+    xsdata.formats.dataclass.context.XmlContext
+        *xsdata* context.
+    """
+
+    from colour_cxf.cxf3 import CxF  # noqa: PLC0415
+
+    context = XmlContext()
+    context.build(CxF)
 
-import colour_cxf.cxf3
+    return context
+
+
+@lru_cache(maxsize=1)
+def _get_parser() -> XmlParser:
+    """
+    Return the generic *xsdata* parser.
+
+    Returns
+    -------
+    xsdata.formats.dataclass.parsers.XmlParser
+        *xsdata* parser.
+    """
+
+    return XmlParser(context=_get_context(), handler=LxmlEventHandler)
+
+
+@lru_cache(maxsize=1)
+def _get_serializer() -> CxFSerializer:
+    """
+    Return the *xsdata* serializer.
+
+    Returns
+    -------
+    colour_cxf._serialize.CxFSerializer
+        *xsdata* serializer.
+    """
+
+    return CxFSerializer(context=_get_context())
 
 
 def read_cxf_from_file(
@@ -60,58 +143,303 @@ def read_cxf_from_file(
     >>> import colour_cxf
     >>> cxf = colour_cxf.read_cxf_from_file("path/to/file.cxf")  # doctest: +SKIP
     """
+    # The file is parsed incrementally, each object is bound as soon as it has
+    # been parsed and its elements are then discarded, thus the whole document
+    # tree is never held in memory.
     with open(source_path, "rb") as file:
-        doc = file.read()
+        cxf = _iterparse_cxf(file, validate_schema)
+        if cxf is not None:
+            return cxf
+
+        # Documents requiring the generic parser are memory-mapped and handed
+        # over to libxml2 without copying them into a bytes object, empty files
+        # and special files that cannot be mapped are read instead.
+        file.seek(0)
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return _read_cxf(file.read(), validate_schema)
+
+        with buffer:
+            return _read_cxf(buffer, validate_schema)
+
+
+def read_cxf_many(
+    source_paths: Iterable[str | PathLike[str]],
+    validate_schema: bool = True,
+    max_workers: int | None = None,
+    chunksize: int = 8,
+) -> list[colour_cxf.cxf3.CxF]:
+    """
+    Read many CxF files in parallel with a pool of processes.
 
-        if validate_schema:
-            _validate_schema(doc)
+    The data binding is pure *Python* and bound by the GIL, distributing the
+    files across processes scales with the number of cores at the cost of
+    pickling the parsed objects back to the calling process.
+
+    Parameters
+    ----------
+    source_paths : Iterable[str or PathLike[str]]
+        Paths to the CxF files to read.
+    validate_schema : bool, optional
+        Whether to validate the schema before parsing the files.
+    max_workers : int, optional
+        Maximum number of processes, defaults to the
+        :class:`concurrent.futures.ProcessPoolExecutor` default.
+    chunksize : int, optional
+        Number of files submitted to a process at once.
 
-        return read_cxf(doc)
+    Returns
+    -------
+    list[colour_cxf.cxf3.CxF]
+        CxF objects containing the parsed data, in the order of the paths.
+
+    Raises
+    ------
+    ParserError
+        If a CxF document does not match the CxF schema.
 
+    Examples
+    --------
+    >>> import colour_cxf
+    >>> cxfs = colour_cxf.read_cxf_many(
+    ...     ["path/to/file_1.cxf", "path/to/file_2.cxf"]
+    ... )  # doctest: +SKIP
+    """
 
-def _validate_schema(doc: bytes) -> None:
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(validate_schema,),
+    ) as executor:
+        return list(
+            executor.map(
+                partial(read_cxf_from_file, validate_schema=validate_schema),
+                source_paths,
+                chunksize=chunksize,
+            )
+        )
+
+
+def _initialize_worker(validate_schema: bool) -> None:
     """
-    Validate the CxF document against the XSD schema.
+    Import the fast parser, build the *xsdata* context and compile the schema
+    once per worker process.
+
+    The package loads them lazily, thus without the initializer the first file
+    of each worker would pay for them.
 
     Parameters
     ----------
-    doc : bytes
-        Bytes data containing the CxF XML content.
+    validate_schema : bool
+        Whether the worker validates the documents against the schema.
+    """
 
+    import colour_cxf._fast_parse  # noqa: F401, PLC0415
+
+    _get_parser()
+
+    if validate_schema:
+        _get_schema()
+
+
+@lru_cache(maxsize=1)
+def _get_schema() -> etree.XMLSchema:
+    """
+    Return the compiled *CxF3* XSD schema.
+
+    The schema is compiled once and cached, subsequent calls return the same
+    :class:`lxml.etree.XMLSchema` instance.
+
+    Returns
+    -------
+    lxml.etree.XMLSchema
+        Compiled *CxF3* XSD schema.
+    """
+
+    with (files("colour_cxf") / "CxF3_Core.xsd").open("rb") as schema_file:
+        return etree.XMLSchema(etree.parse(schema_file))
+
+
+def _load_schema() -> etree.XMLSchema:
+    """
+    Return the compiled *CxF3* XSD schema for validating a document.
+
+    Returns
+    -------
+    lxml.etree.XMLSchema
+        Compiled *CxF3* XSD schema.
+
+    Raises
+    ------
+    ParserError
+        If the schema cannot be read or compiled.
+    """
+
+    try:
+        return _get_schema()
+    except (
+        OSError,
+        etree.XMLSyntaxError,
+        etree.XMLSchemaParseError,
+        etree.XSLTParseError,
+    ) as e:
+        msg = f"Schema validation error: {e}"
+        raise ParserError(msg) from e
+
+
+def _validate_schema(source: Buffer) -> etree._Element | None:
+    """
+    Parse the CxF document and validate it against the XSD schema.
+
+    Parsing and validation happen in a single *libxml2* pass, the returned tree
+    can be handed over to the data binding parser without parsing the document
+    again.
+
+    Parameters
+    ----------
+    source : Buffer
+        Bytes data or buffer, e.g., a memory-mapped file, containing the CxF
+        XML content.
+
+    Returns
+    -------
+    lxml.etree._Element or None
+        Root element of the validated CxF document.
 
     Raises
     ------
     ParserError
         If the CxF document does not match the CxF schema.
     """
+    parser = etree.XMLParser(
+        schema=_load_schema(),
+        huge_tree=True,
+        remove_comments=True,
+    )
+
+    # lxml parses any object supporting the buffer protocol, its stubs only
+    # declare "str" and "bytes" though.
+    document = cast("bytes", source)
+
     try:
-        parsed_xml = etree.parse(BytesIO(doc))
+        return etree.fromstring(document, parser)
     except etree.XMLSyntaxError as e:
-        msg = f"XML is not well-formed: {e}"
-        raise ParserError(msg) from e
+        raise _parser_error(e, partial(etree.fromstring, document)) from e
+
+
+def _parser_error(
+    exception: etree.XMLSyntaxError,
+    parse: Callable[[etree.XMLParser], etree._Element],
+) -> ParserError:
+    """
+    Return the exception describing given *lxml* syntax error.
+
+    The validating parser stops at the first error, whether the document is not
+    well-formed or does not match the schema, and reports schema errors without
+    line numbers. The document is thus parsed again without the schema and, if
+    it is well-formed, validated separately.
+
+    Parameters
+    ----------
+    exception : lxml.etree.XMLSyntaxError
+        *lxml* syntax error raised while parsing and validating the document.
+    parse : Callable
+        Callable parsing the document again with given parser and returning its
+        root element.
+
+    Returns
+    -------
+    ParserError
+        Exception distinguishing between not well-formed and schema invalid
+        documents.
+    """
 
     try:
-        with open("CxF3_Core.xsd") as schema_file:
-            xmlschema_doc = etree.parse(schema_file)
-            xmlschema = etree.XMLSchema(xmlschema_doc)
-
-            if not xmlschema.validate(parsed_xml):
-                errors = xmlschema.error_log
-                msg = f"Schema validation failed: {errors}"
-                raise ParserError(msg)
-    except (etree.XMLSyntaxError, etree.XSLTParseError) as e:
-        msg = f"Schema validation error: {e}"
-        raise ParserError(msg) from e
+        tree = parse(etree.XMLParser(huge_tree=True))
+    except etree.XMLSyntaxError as e:
+        return ParserError(f"XML is not well-formed: {e}")
+
+    schema = _get_schema()
+    if schema.validate(tree):
+        return ParserError(f"Schema validation failed: {exception}")
 
+    return ParserError(f"Schema validation failed: {schema.error_log}")
 
-def read_cxf(doc: bytes, validate_schema: bool = True) -> colour_cxf.cxf3.CxF:
+
+def _iterparse_cxf(
+    file: BinaryIO, validate_schema: bool = True
+) -> colour_cxf.cxf3.CxF | None:
     """
-    Read a CxF object from bytes data.
+    Read a CxF object incrementally from a binary file object.
+
+    The objects are bound by the generated parser as soon as they have been
+    parsed and validated, their elements are then discarded.
 
     Parameters
     ----------
-    doc : bytes
-        Bytes data containing the CxF XML content.
+    file : BinaryIO
+        Binary file object containing the CxF XML content.
+    validate_schema : bool, optional
+        Whether to validate the schema while parsing the file.
+
+    Returns
+    -------
+    colour_cxf.cxf3.CxF or None
+        CxF object containing the parsed data or *None* if the document
+        requires the generic *xsdata* parser.
+
+    Raises
+    ------
+    ParserError
+        If the CxF document does not match the CxF schema.
+    """
+
+    from colour_cxf._fast_parse import (  # noqa: PLC0415
+        OBJECT_TAG,
+        FastParserError,
+        parse_cxf_events,
+    )
+
+    options = (
+        {"schema": _load_schema(), "huge_tree": True}
+        if validate_schema
+        else {"recover": True}
+    )
+    events = etree.iterparse(
+        file,
+        events=("end",),
+        tag=OBJECT_TAG,
+        remove_comments=True,
+        **options,
+    )
+
+    try:
+        return parse_cxf_events(events)
+    except etree.XMLSyntaxError as e:
+        if validate_schema:
+            # The document is parsed again from its contents so that the
+            # messages match the ones of "read_cxf".
+            file.seek(0)
+            raise _parser_error(e, partial(etree.fromstring, file.read())) from e
+    except (FastParserError, ConverterError, ValueError):
+        pass
+
+    return None
+
+
+def read_cxf(doc: Buffer, validate_schema: bool = True) -> colour_cxf.cxf3.CxF:
+    """
+    Read a CxF object from bytes data or any object supporting the buffer
+    protocol, e.g., :class:`bytearray`, :class:`memoryview` or
+    :class:`mmap.mmap`.
+
+    The buffer is handed over to *libxml2* without being copied.
+
+    Parameters
+    ----------
+    doc : Buffer
+        Bytes data or buffer containing the CxF XML content.
     validate_schema : bool, optional
         Whether to validate the schema before parsing the file.
 
@@ -131,14 +459,65 @@ def read_cxf(doc: bytes, validate_schema: bool = True) -> colour_cxf.cxf3.CxF:
     >>> with open("path/to/file.cxf", "rb") as f:  # doctest: +SKIP
     ...     data = f.read()
     >>> cxf = colour_cxf.read_cxf(data)  # doctest: +SKIP
+    >>> import mmap
+    >>> with open("path/to/file.cxf", "rb") as f:  # doctest: +SKIP
+    ...     with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+    ...         cxf = colour_cxf.read_cxf(data)
     """
 
-    if validate_schema:
-        _validate_schema(doc)
+    return _read_cxf(doc, validate_schema)
 
-    context = XmlContext()
-    parser = XmlParser(context=context)
-    return parser.from_bytes(doc, colour_cxf.cxf3.CxF)
+
+def _read_cxf(source: Buffer, validate_schema: bool = True) -> colour_cxf.cxf3.CxF:
+    """
+    Read a CxF object from bytes data or a buffer.
+
+    Parameters
+    ----------
+    source : Buffer
+        Bytes data or buffer, e.g., a memory-mapped file, containing the CxF
+        XML content.
+    validate_schema : bool, optional
+        Whether to validate the schema before parsing the file.
+
+    Returns
+    -------
+    colour_cxf.cxf3.CxF
+        CxF object containing the parsed data.
+
+    Raises
+    ------
+    ParserError
+        If the CxF document does not match the CxF schema.
+    """
+
+    if validate_schema:
+        tree = _validate_schema(source)
+    else:
+        try:
+            tree = etree.fromstring(
+                # See "_validate_schema" for the buffer protocol support.
+                cast("bytes", source),
+                etree.XMLParser(recover=True, remove_comments=True),
+            )
+        except etree.XMLSyntaxError:
+            tree = None
+
+    from colour_cxf._fast_parse import (  # noqa: PLC0415
+        FastParserError,
+        parse_cxf,
+    )
+    from colour_cxf.cxf3 import CxF  # noqa: PLC0415
+
+    if tree is not None:
+        with suppress(FastParserError, ConverterError, ValueError):
+            return parse_cxf(tree)
+
+    # Documents that the generated parser does not handle, e.g., with type
+    # substitutions or unconvertible values, go through the generic parser. A
+    # fresh namespace map per call prevents the shared parser from accumulating
+    # prefixes across documents.
+    return _get_parser().from_bytes(bytes(source), CxF, {})
 
 
 def write_cxf(cxf: colour_cxf.cxf3.CxF) -> bytes:
@@ -164,5 +543,39 @@ def write_cxf(cxf: colour_cxf.cxf3.CxF) -> bytes:
     >>> with open("path/to/output.cxf", "wb") as f:  # doctest: +SKIP
     ...     f.write(xml_bytes)
     """
-    serializer = XmlSerializer()
-    return serializer.render(cxf).encode("utf-8")
+
+    # The serializer output is encoded incrementally into the buffer rather
+    # than rendered into an intermediate string and encoded afterwards.
+    buffer = io.BytesIO()
+    with io.TextIOWrapper(buffer, encoding="utf-8", newline="") as text_buffer:
+        _get_serializer().write(text_buffer, cxf)
+        text_buffer.flush()
+
+        return buffer.getvalue()
+
+
+def write_cxf_to_file(
+    cxf: colour_cxf.cxf3.CxF, target_path: str | PathLike[str]
+) -> None:
+    """
+    Write a CxF object to a file path.
+
+    The document is streamed to the file while it is serialized, it is never
+    held in memory as a whole.
+
+    Parameters
+    ----------
+    cxf : colour_cxf.cxf3.CxF
+        CxF object to serialize.
+    target_path : str or PathLike[str]
+        Path to the CxF file to write.
+
+    Examples
+    --------
+    >>> import colour_cxf
+    >>> cxf = colour_cxf.read_cxf_from_file("path/to/file.cxf")  # doctest: +SKIP
+    >>> colour_cxf.write_cxf_to_file(cxf, "path/to/output.cxf")  # doctest: +SKIP
+    """
+
+    with open(target_path, "w", encoding="utf-8", newline="") as file:
+        _get_serializer().write(file, cxf)
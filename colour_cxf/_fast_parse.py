@@ -0,0 +1,2964 @@
+"""
+Fast Parser
+===========
+
+Define *lxml* based parsing functions for the :mod:`colour_cxf.cxf3` data
+classes.
+
+This module was generated by ``utilities/generate_fast_parser.py``, it must
+not be edited manually.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from lxml import etree
+from xsdata.formats.converter import converter
+from xsdata.models.datatype import XmlDateTime
+
+from colour_cxf import _get_parser
+from colour_cxf.cxf3 import (
+    Brdfangle,
+    ColorAdobeRgb,
+    ColorCielab,
+    ColorCielch,
+    ColorCieluv,
+    ColorCiexyY,
+    ColorCiexyz,
+    ColorCmyk,
+    ColorCmykplusN,
+    ColorCustom,
+    ColorDensity,
+    ColorDifferenceValues,
+    ColorEmissiveCiexyY,
+    ColorEmissiveCiexyz,
+    ColorHsl,
+    ColorHtml,
+    ColorNotation,
+    ColorPantoneHexachrome,
+    ColorRecipe,
+    ColorRgb,
+    ColorSpecification,
+    ColorSpecificationCollection,
+    ColorSrgb,
+    ColorValues,
+    Colorant,
+    CreationDate,
+    CustomAttributeString,
+    CustomAttributeValue,
+    CustomColorSpace,
+    CustomDataType,
+    CustomDeltaType,
+    CustomIlluminant,
+    CustomResources,
+    CustomSpectrum,
+    CxF,
+    De2000Type,
+    De94Type,
+    DecmcType,
+    DeltaCielab,
+    DeltaCustom,
+    Device,
+    DeviceClass,
+    DeviceColorValues,
+    DeviceFilter,
+    DeviceIllumination,
+    EastmTableType,
+    EdensityFilterType,
+    EdensityStatusType,
+    EdeviceClassType,
+    EdeviceIlluminationType,
+    EemissiveModeType,
+    EfilterType,
+    EfinishType,
+    EilluminantType,
+    EluminanceUnits,
+    EmissiveSpectrum,
+    EobserverType,
+    EsingleAngleConfigurationType,
+    EspectrumType,
+    EsphereType,
+    EsubstrateType,
+    EtargetType,
+    FileInformation,
+    FinishType,
+    GeometryChoice,
+    Gloss,
+    Height,
+    Illuminant,
+    Image,
+    Length,
+    LuminanceUnitsType,
+    MeasurementSpec,
+    MeasurementType,
+    Method,
+    MultiAngleType,
+    Object,
+    ObjectCollection,
+    Observer,
+    Opacity,
+    PhysicalAttributes,
+    PrivateColorValues,
+    PrivateSpectrum,
+    Process,
+    Profile,
+    ProfileCollection,
+    ProfileTypeDirection,
+    ProfileTypeParameters,
+    ProfileTypeParametersValueChoice,
+    ProfileTypeProfileChoice,
+    ProfileTypeProfileChoiceProfileFile,
+    Quantity,
+    ReflectanceSpectrum,
+    Resources,
+    SingleAngleConfiguration,
+    SingleAngleType,
+    SpectralPoint,
+    SpotColorType,
+    Substrate,
+    SubstrateType,
+    Tag,
+    TagCollection,
+    TargetType,
+    Thickness,
+    TransmittanceSpectrum,
+    TristimulusSpec,
+    WavelengthRange,
+    Width,
+)
+
+__all__ = [
+    "FastParserError",
+    "OBJECT_TAG",
+    "parse_cxf",
+    "parse_cxf_events",
+]
+
+
+class FastParserError(Exception):
+    """
+    Raise when a document requires the generic *xsdata* parser.
+    """
+
+
+_XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+
+_XSI_ATTRIBUTES = etree.XPath(
+    "descendant-or-self::*/@xsi:type | descendant-or-self::*/@xsi:nil",
+    namespaces={"xsi": _XSI_NAMESPACE},
+)
+
+
+def _parse_generic(elem: etree._Element, clazz: type) -> object:
+    """
+    Parse given element with the generic *xsdata* parser, sharing its context
+    with the :mod:`colour_cxf` module.
+
+    The generic parser binds the text following the element, i.e., its tail,
+    in place of the element when it is not whitespace, such documents are left
+    to the generic parser as a whole.
+    """
+
+    if elem.tail is not None and elem.tail.strip():
+        raise FastParserError(elem.tag)
+
+    return _get_parser().parse(elem, clazz, {})
+
+
+_TYPES_0 = (EdensityStatusType,)
+_TYPES_1 = (EdensityFilterType,)
+_TYPES_2 = (bool,)
+_TYPES_3 = (XmlDateTime,)
+_TYPES_4 = (EdeviceClassType,)
+_TYPES_5 = (EfilterType,)
+_TYPES_6 = (EdeviceIlluminationType,)
+_TYPES_7 = (EfinishType,)
+_TYPES_8 = (EemissiveModeType,)
+_TYPES_9 = (EsphereType,)
+_TYPES_10 = (EilluminantType,)
+_TYPES_11 = (bytes,)
+_TYPES_12 = (EluminanceUnits,)
+_TYPES_13 = (EspectrumType,)
+_TYPES_14 = (EastmTableType,)
+_TYPES_15 = (EobserverType,)
+_TYPES_16 = (ProfileTypeDirection,)
+_TYPES_17 = (EsingleAngleConfigurationType,)
+_TYPES_18 = (EsubstrateType,)
+_TYPES_19 = (EtargetType,)
+
+
+def _parse_Brdfangle(elem: etree._Element) -> Brdfangle:
+    """Parse given element into :class:`Brdfangle`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Notation")
+    if value is not None:
+        params["notation"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}IlluminationAngle":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "illumination_angle" in params:
+                raise FastParserError(tag)
+            params["illumination_angle"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Aspecular":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "aspecular" in params:
+                raise FastParserError(tag)
+            params["aspecular"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Azimuth":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "azimuth" in params:
+                raise FastParserError(tag)
+            params["azimuth"] = value
+        else:
+            raise FastParserError(tag)
+    return Brdfangle(**params)
+
+
+def _parse_ColorAdobeRgb(elem: etree._Element) -> ColorAdobeRgb:
+    """Parse given element into :class:`ColorAdobeRgb`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("ProfileSpecification")
+    if value is not None:
+        params["profile_specification"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}MaxRange":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "max_range" in params:
+                raise FastParserError(tag)
+            params["max_range"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}R":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "r" in params:
+                raise FastParserError(tag)
+            params["r"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}G":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "g" in params:
+                raise FastParserError(tag)
+            params["g"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}B":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "b" in params:
+                raise FastParserError(tag)
+            params["b"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Alpha":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "alpha" in params:
+                raise FastParserError(tag)
+            params["alpha"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorAdobeRgb(**params)
+
+
+def _parse_ColorCielab(elem: etree._Element) -> ColorCielab:
+    """Parse given element into :class:`ColorCielab`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}L":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "l" in params:
+                raise FastParserError(tag)
+            params["l"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}A":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "a" in params:
+                raise FastParserError(tag)
+            params["a"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}B":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "b" in params:
+                raise FastParserError(tag)
+            params["b"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorCielab(**params)
+
+
+def _parse_ColorCielch(elem: etree._Element) -> ColorCielch:
+    """Parse given element into :class:`ColorCielch`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}L":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "l" in params:
+                raise FastParserError(tag)
+            params["l"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}C":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "c" in params:
+                raise FastParserError(tag)
+            params["c"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}H":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "h" in params:
+                raise FastParserError(tag)
+            params["h"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorCielch(**params)
+
+
+def _parse_ColorCieluv(elem: etree._Element) -> ColorCieluv:
+    """Parse given element into :class:`ColorCieluv`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}L":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "l" in params:
+                raise FastParserError(tag)
+            params["l"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}U":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "u" in params:
+                raise FastParserError(tag)
+            params["u"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}V":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "v" in params:
+                raise FastParserError(tag)
+            params["v"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorCieluv(**params)
+
+
+def _parse_ColorCiexyY(elem: etree._Element) -> ColorCiexyY:
+    """Parse given element into :class:`ColorCiexyY`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}x":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "x" in params:
+                raise FastParserError(tag)
+            params["x"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}y":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "y" in params:
+                raise FastParserError(tag)
+            params["y"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Y":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "colorexchangeformat_com_cx_f3_core_y" in params:
+                raise FastParserError(tag)
+            params["colorexchangeformat_com_cx_f3_core_y"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorCiexyY(**params)
+
+
+def _parse_ColorCiexyz(elem: etree._Element) -> ColorCiexyz:
+    """Parse given element into :class:`ColorCiexyz`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}X":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "x" in params:
+                raise FastParserError(tag)
+            params["x"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Y":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "y" in params:
+                raise FastParserError(tag)
+            params["y"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Z":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "z" in params:
+                raise FastParserError(tag)
+            params["z"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorCiexyz(**params)
+
+
+def _parse_ColorCmyk(elem: etree._Element) -> ColorCmyk:
+    """Parse given element into :class:`ColorCmyk`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("ProfileSpecification")
+    if value is not None:
+        params["profile_specification"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Cyan":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "cyan" in params:
+                raise FastParserError(tag)
+            params["cyan"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Magenta":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "magenta" in params:
+                raise FastParserError(tag)
+            params["magenta"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Yellow":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "yellow" in params:
+                raise FastParserError(tag)
+            params["yellow"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Black":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "black" in params:
+                raise FastParserError(tag)
+            params["black"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorCmyk(**params)
+
+
+def _parse_ColorCmykplusN(elem: etree._Element) -> ColorCmykplusN:
+    """Parse given element into :class:`ColorCmykplusN`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("ProfileSpecification")
+    if value is not None:
+        params["profile_specification"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Cyan":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "cyan" in params:
+                raise FastParserError(tag)
+            params["cyan"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Magenta":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "magenta" in params:
+                raise FastParserError(tag)
+            params["magenta"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Yellow":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "yellow" in params:
+                raise FastParserError(tag)
+            params["yellow"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Black":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "black" in params:
+                raise FastParserError(tag)
+            params["black"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}SpotColor":
+            value = _parse_SpotColorType(child)
+            values = params.get("spot_color")
+            if values is None:
+                params["spot_color"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ColorCmykplusN(**params)
+
+
+def _parse_ColorCustom(elem: etree._Element) -> ColorCustom:
+    """Parse given element into :class:`ColorCustom`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("ProfileSpecification")
+    if value is not None:
+        params["profile_specification"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}SpotColor":
+            value = _parse_SpotColorType(child)
+            values = params.get("spot_color")
+            if values is None:
+                params["spot_color"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ColorCustom(**params)
+
+
+def _parse_ColorDensity(elem: etree._Element) -> ColorDensity:
+    """Parse given element into :class:`ColorDensity`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Density":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "density" in params:
+                raise FastParserError(tag)
+            params["density"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Status":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else converter.deserialize(text, _TYPES_0)
+            if "status" in params:
+                raise FastParserError(tag)
+            params["status"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Filter":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else converter.deserialize(text, _TYPES_1)
+            if "filter" in params:
+                raise FastParserError(tag)
+            params["filter"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}BaseOffset":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "base_offset" in params:
+                raise FastParserError(tag)
+            params["base_offset"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorDensity(**params)
+
+
+def _parse_ColorDifferenceValues(elem: etree._Element) -> ColorDifferenceValues:
+    """Parse given element into :class:`ColorDifferenceValues`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if (parse := _CHOICES_0.get(tag)) is not None:
+            value = parse(child)
+            values = params.get("delta_cielab_or_delta_custom")
+            if values is None:
+                params["delta_cielab_or_delta_custom"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ColorDifferenceValues(**params)
+
+
+def _parse_ColorEmissiveCiexyY(elem: etree._Element) -> ColorEmissiveCiexyY:
+    """Parse given element into :class:`ColorEmissiveCiexyY`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}x":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "x" in params:
+                raise FastParserError(tag)
+            params["x"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}y":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "y" in params:
+                raise FastParserError(tag)
+            params["y"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Y":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "colorexchangeformat_com_cx_f3_core_y" in params:
+                raise FastParserError(tag)
+            params["colorexchangeformat_com_cx_f3_core_y"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorEmissiveCiexyY(**params)
+
+
+def _parse_ColorEmissiveCiexyz(elem: etree._Element) -> ColorEmissiveCiexyz:
+    """Parse given element into :class:`ColorEmissiveCiexyz`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}X":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "x" in params:
+                raise FastParserError(tag)
+            params["x"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Y":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "y" in params:
+                raise FastParserError(tag)
+            params["y"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Z":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "z" in params:
+                raise FastParserError(tag)
+            params["z"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorEmissiveCiexyz(**params)
+
+
+def _parse_ColorHsl(elem: etree._Element) -> ColorHsl:
+    """Parse given element into :class:`ColorHsl`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Hue":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "hue" in params:
+                raise FastParserError(tag)
+            params["hue"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Saturation":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "saturation" in params:
+                raise FastParserError(tag)
+            params["saturation"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Lightness":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "lightness" in params:
+                raise FastParserError(tag)
+            params["lightness"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorHsl(**params)
+
+
+def _parse_ColorHtml(elem: etree._Element) -> ColorHtml:
+    """Parse given element into :class:`ColorHtml`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("HTML")
+    if value is not None:
+        params["html"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    return ColorHtml(**params)
+
+
+def _parse_ColorNotation(elem: etree._Element) -> ColorNotation:
+    """Parse given element into :class:`ColorNotation`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Notation")
+    if value is not None:
+        params["notation"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    return ColorNotation(**params)
+
+
+def _parse_ColorPantoneHexachrome(elem: etree._Element) -> ColorPantoneHexachrome:
+    """Parse given element into :class:`ColorPantoneHexachrome`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("ProfileSpecification")
+    if value is not None:
+        params["profile_specification"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Cyan":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "cyan" in params:
+                raise FastParserError(tag)
+            params["cyan"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Magenta":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "magenta" in params:
+                raise FastParserError(tag)
+            params["magenta"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Yellow":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "yellow" in params:
+                raise FastParserError(tag)
+            params["yellow"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Black":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "black" in params:
+                raise FastParserError(tag)
+            params["black"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Orange":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "orange" in params:
+                raise FastParserError(tag)
+            params["orange"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Green":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "green" in params:
+                raise FastParserError(tag)
+            params["green"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorPantoneHexachrome(**params)
+
+
+def _parse_ColorRecipe(elem: etree._Element) -> ColorRecipe:
+    """Parse given element into :class:`ColorRecipe`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Units")
+    if value is not None:
+        params["units"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("Comments")
+    if value is not None:
+        params["comments"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}CreationDate":
+            value = _parse_CreationDate(child)
+            if "creation_date" in params:
+                raise FastParserError(tag)
+            params["creation_date"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Tag":
+            value = _parse_Tag(child)
+            values = params.get("tag")
+            if values is None:
+                params["tag"] = [value]
+            else:
+                values.append(value)
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Substrate":
+            value = _parse_Substrate(child)
+            if "substrate" in params:
+                raise FastParserError(tag)
+            params["substrate"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Process":
+            value = _parse_Process(child)
+            if "process" in params:
+                raise FastParserError(tag)
+            params["process"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Colorant":
+            value = _parse_Colorant(child)
+            values = params.get("colorant")
+            if values is None:
+                params["colorant"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ColorRecipe(**params)
+
+
+def _parse_ColorRgb(elem: etree._Element) -> ColorRgb:
+    """Parse given element into :class:`ColorRgb`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    value = attrib.get("ProfileSpecification")
+    if value is not None:
+        params["profile_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}MaxRange":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "max_range" in params:
+                raise FastParserError(tag)
+            params["max_range"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}R":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "r" in params:
+                raise FastParserError(tag)
+            params["r"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}G":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "g" in params:
+                raise FastParserError(tag)
+            params["g"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}B":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "b" in params:
+                raise FastParserError(tag)
+            params["b"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorRgb(**params)
+
+
+def _parse_ColorSpecification(elem: etree._Element) -> ColorSpecification:
+    """Parse given element into :class:`ColorSpecification`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Id")
+    if value is not None:
+        params["id"] = value
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}TristimulusSpec":
+            value = _parse_TristimulusSpec(child)
+            if "tristimulus_spec" in params:
+                raise FastParserError(tag)
+            params["tristimulus_spec"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}MeasurementSpec":
+            value = _parse_MeasurementSpec(child)
+            if "measurement_spec" in params:
+                raise FastParserError(tag)
+            params["measurement_spec"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}PhysicalAttributes":
+            value = _parse_PhysicalAttributes(child)
+            if "physical_attributes" in params:
+                raise FastParserError(tag)
+            params["physical_attributes"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorSpecification(**params)
+
+
+def _parse_ColorSpecificationCollection(
+    elem: etree._Element,
+) -> ColorSpecificationCollection:
+    """Parse given element into :class:`ColorSpecificationCollection`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}ColorSpecification":
+            value = _parse_ColorSpecification(child)
+            values = params.get("color_specification")
+            if values is None:
+                params["color_specification"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ColorSpecificationCollection(**params)
+
+
+def _parse_ColorSrgb(elem: etree._Element) -> ColorSrgb:
+    """Parse given element into :class:`ColorSrgb`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}MaxRange":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "max_range" in params:
+                raise FastParserError(tag)
+            params["max_range"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}R":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "r" in params:
+                raise FastParserError(tag)
+            params["r"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}G":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "g" in params:
+                raise FastParserError(tag)
+            params["g"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}B":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "b" in params:
+                raise FastParserError(tag)
+            params["b"] = value
+        else:
+            raise FastParserError(tag)
+    return ColorSrgb(**params)
+
+
+def _parse_ColorValues(elem: etree._Element) -> ColorValues:
+    """Parse given element into :class:`ColorValues`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if (parse := _CHOICES_1.get(tag)) is not None:
+            value = parse(child)
+            values = params.get("choice")
+            if values is None:
+                params["choice"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ColorValues(**params)
+
+
+def _parse_Colorant(elem: etree._Element) -> Colorant:
+    """Parse given element into :class:`Colorant`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ID")
+    if value is not None:
+        params["id"] = value
+    value = attrib.get("isBase")
+    if value is not None:
+        params["is_base"] = converter.deserialize(value, _TYPES_2)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}PartNumber":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "part_number" in params:
+                raise FastParserError(tag)
+            params["part_number"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Density":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = None if text is None else float(text)
+            if "density" in params:
+                raise FastParserError(tag)
+            params["density"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Value":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "value" in params:
+                raise FastParserError(tag)
+            params["value"] = value
+        else:
+            raise FastParserError(tag)
+    return Colorant(**params)
+
+
+def _parse_CreationDate(elem: etree._Element) -> CreationDate:
+    """Parse given element into :class:`CreationDate`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_3)
+    return CreationDate(**params)
+
+
+def _parse_CustomAttributeString(elem: etree._Element) -> CustomAttributeString:
+    """Parse given element into :class:`CustomAttributeString`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Label")
+    if value is not None:
+        params["label"] = sys.intern(value)
+    value = attrib.get("Method")
+    if value is not None:
+        params["method"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = text
+    return CustomAttributeString(**params)
+
+
+def _parse_CustomAttributeValue(elem: etree._Element) -> CustomAttributeValue:
+    """Parse given element into :class:`CustomAttributeValue`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Label")
+    if value is not None:
+        params["label"] = sys.intern(value)
+    value = attrib.get("Method")
+    if value is not None:
+        params["method"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return CustomAttributeValue(**params)
+
+
+def _parse_CustomColorSpace(elem: etree._Element) -> CustomColorSpace:
+    """Parse given element into :class:`CustomColorSpace`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Value":
+            value = _parse_CustomDataType(child)
+            values = params.get("value")
+            if values is None:
+                params["value"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return CustomColorSpace(**params)
+
+
+def _parse_CustomDataType(elem: etree._Element) -> CustomDataType:
+    """Parse given element into :class:`CustomDataType`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Label")
+    if value is not None:
+        params["label"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return CustomDataType(**params)
+
+
+def _parse_CustomDeltaType(elem: etree._Element) -> CustomDeltaType:
+    """Parse given element into :class:`CustomDeltaType`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Label")
+    if value is not None:
+        params["label"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return CustomDeltaType(**params)
+
+
+def _parse_CustomIlluminant(elem: etree._Element) -> CustomIlluminant:
+    """Parse given element into :class:`CustomIlluminant`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("WLStart")
+    if value is not None:
+        params["wlstart"] = int(value)
+    value = attrib.get("List_Increment")
+    if value is not None:
+        params["list_increment"] = int(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}SPDList":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = [] if text is None else list(map(float, text.split()))
+            if "spdlist" in params:
+                raise FastParserError(tag)
+            params["spdlist"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}SpectralPoint":
+            value = _parse_SpectralPoint(child)
+            values = params.get("spectral_point")
+            if values is None:
+                params["spectral_point"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return CustomIlluminant(**params)
+
+
+def _parse_CustomResources(elem: etree._Element) -> CustomResources:
+    """Parse given element into :class:`CustomResources`."""
+
+    return _parse_generic(elem, CustomResources)  # type: ignore
+
+
+def _parse_CustomSpectrum(elem: etree._Element) -> CustomSpectrum:
+    """Parse given element into :class:`CustomSpectrum`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("MeasureDate")
+    if value is not None:
+        params["measure_date"] = converter.deserialize(value, _TYPES_3)
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}SpectralPoint":
+            value = _parse_SpectralPoint(child)
+            values = params.get("spectral_point")
+            if values is None:
+                params["spectral_point"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return CustomSpectrum(**params)
+
+
+def _parse_CxF(elem: etree._Element) -> CxF:
+    """Parse given element into :class:`CxF`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}FileInformation":
+            value = _parse_FileInformation(child)
+            if "file_information" in params:
+                raise FastParserError(tag)
+            params["file_information"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Resources":
+            value = _parse_Resources(child)
+            if "resources" in params:
+                raise FastParserError(tag)
+            params["resources"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}CustomResources":
+            value = _parse_CustomResources(child)
+            if "custom_resources" in params:
+                raise FastParserError(tag)
+            params["custom_resources"] = value
+        else:
+            raise FastParserError(tag)
+    return CxF(**params)
+
+
+def _parse_De2000Type(elem: etree._Element) -> De2000Type:
+    """Parse given element into :class:`De2000Type`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("LRatio")
+    if value is not None:
+        params["lratio"] = float(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return De2000Type(**params)
+
+
+def _parse_De94Type(elem: etree._Element) -> De94Type:
+    """Parse given element into :class:`De94Type`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("LRatio")
+    if value is not None:
+        params["lratio"] = float(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return De94Type(**params)
+
+
+def _parse_DecmcType(elem: etree._Element) -> DecmcType:
+    """Parse given element into :class:`DecmcType`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("LRatio")
+    if value is not None:
+        params["lratio"] = float(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return DecmcType(**params)
+
+
+def _parse_DeltaCielab(elem: etree._Element) -> DeltaCielab:
+    """Parse given element into :class:`DeltaCielab`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    value = attrib.get("StandardRef")
+    if value is not None:
+        params["standard_ref"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}dL":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "d_l" in params:
+                raise FastParserError(tag)
+            params["d_l"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dA":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "d_a" in params:
+                raise FastParserError(tag)
+            params["d_a"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dB":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "d_b" in params:
+                raise FastParserError(tag)
+            params["d_b"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dC":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "d_c" in params:
+                raise FastParserError(tag)
+            params["d_c"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dH":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "d_h" in params:
+                raise FastParserError(tag)
+            params["d_h"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dE":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "d_e" in params:
+                raise FastParserError(tag)
+            params["d_e"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dEcmc":
+            value = _parse_DecmcType(child)
+            if "d_ecmc" in params:
+                raise FastParserError(tag)
+            params["d_ecmc"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dE94":
+            value = _parse_De94Type(child)
+            if "d_e94" in params:
+                raise FastParserError(tag)
+            params["d_e94"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}dE2000":
+            value = _parse_De2000Type(child)
+            if "d_e2000" in params:
+                raise FastParserError(tag)
+            params["d_e2000"] = value
+        else:
+            raise FastParserError(tag)
+    return DeltaCielab(**params)
+
+
+def _parse_DeltaCustom(elem: etree._Element) -> DeltaCustom:
+    """Parse given element into :class:`DeltaCustom`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    value = attrib.get("StandardRef")
+    if value is not None:
+        params["standard_ref"] = sys.intern(value)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}DeltaValue":
+            value = _parse_CustomDeltaType(child)
+            values = params.get("delta_value")
+            if values is None:
+                params["delta_value"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return DeltaCustom(**params)
+
+
+def _parse_Device(elem: etree._Element) -> Device:
+    """Parse given element into :class:`Device`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Manufacturer":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "manufacturer" in params:
+                raise FastParserError(tag)
+            params["manufacturer"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Model":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "model" in params:
+                raise FastParserError(tag)
+            params["model"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}SerialNumber":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "serial_number" in params:
+                raise FastParserError(tag)
+            params["serial_number"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}DeviceClass":
+            value = _parse_DeviceClass(child)
+            if "device_class" in params:
+                raise FastParserError(tag)
+            params["device_class"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}DeviceFilter":
+            value = _parse_DeviceFilter(child)
+            if "device_filter" in params:
+                raise FastParserError(tag)
+            params["device_filter"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}DeviceIllumination":
+            value = _parse_DeviceIllumination(child)
+            if "device_illumination" in params:
+                raise FastParserError(tag)
+            params["device_illumination"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}DevicePolarization":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else converter.deserialize(text, _TYPES_2)
+            if "device_polarization" in params:
+                raise FastParserError(tag)
+            params["device_polarization"] = value
+        else:
+            raise FastParserError(tag)
+    return Device(**params)
+
+
+def _parse_DeviceClass(elem: etree._Element) -> DeviceClass:
+    """Parse given element into :class:`DeviceClass`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_4)
+    return DeviceClass(**params)
+
+
+def _parse_DeviceColorValues(elem: etree._Element) -> DeviceColorValues:
+    """Parse given element into :class:`DeviceColorValues`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if (parse := _CHOICES_2.get(tag)) is not None:
+            value = parse(child)
+            values = params.get("choice")
+            if values is None:
+                params["choice"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return DeviceColorValues(**params)
+
+
+def _parse_DeviceFilter(elem: etree._Element) -> DeviceFilter:
+    """Parse given element into :class:`DeviceFilter`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("FilterDescription")
+    if value is not None:
+        params["filter_description"] = value
+    value = attrib.get("FilterPosition")
+    if value is not None:
+        params["filter_position"] = float(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_5)
+    return DeviceFilter(**params)
+
+
+def _parse_DeviceIllumination(elem: etree._Element) -> DeviceIllumination:
+    """Parse given element into :class:`DeviceIllumination`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("CustomType")
+    if value is not None:
+        params["custom_type"] = value
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_6)
+    return DeviceIllumination(**params)
+
+
+def _parse_EmissiveSpectrum(elem: etree._Element) -> EmissiveSpectrum:
+    """Parse given element into :class:`EmissiveSpectrum`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("MeasureDate")
+    if value is not None:
+        params["measure_date"] = converter.deserialize(value, _TYPES_3)
+    value = attrib.get("StartWL")
+    if value is not None:
+        params["start_wl"] = int(value)
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = list(map(float, text.split()))
+    return EmissiveSpectrum(**params)
+
+
+def _parse_FileInformation(elem: etree._Element) -> FileInformation:
+    """Parse given element into :class:`FileInformation`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Creator":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "creator" in params:
+                raise FastParserError(tag)
+            params["creator"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}CreationDate":
+            value = _parse_CreationDate(child)
+            if "creation_date" in params:
+                raise FastParserError(tag)
+            params["creation_date"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Description":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "description" in params:
+                raise FastParserError(tag)
+            params["description"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Comment":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "comment" in params:
+                raise FastParserError(tag)
+            params["comment"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Tag":
+            value = _parse_Tag(child)
+            values = params.get("tag")
+            if values is None:
+                params["tag"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return FileInformation(**params)
+
+
+def _parse_FinishType(elem: etree._Element) -> FinishType:
+    """Parse given element into :class:`FinishType`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("OtherType")
+    if value is not None:
+        params["other_type"] = value
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_7)
+    return FinishType(**params)
+
+
+def _parse_GeometryChoice(elem: etree._Element) -> GeometryChoice:
+    """Parse given element into :class:`GeometryChoice`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}EmissiveMode":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else converter.deserialize(text, _TYPES_8)
+            if "choice" in params:
+                raise FastParserError(tag)
+            params["choice"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}SphereGeometry":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else converter.deserialize(text, _TYPES_9)
+            if "choice" in params:
+                raise FastParserError(tag)
+            params["choice"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}SingleAngle":
+            value = _parse_SingleAngleType(child)
+            if "choice" in params:
+                raise FastParserError(tag)
+            params["choice"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}UnknownGeometry":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "choice" in params:
+                raise FastParserError(tag)
+            params["choice"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}MultiAngle":
+            value = _parse_MultiAngleType(child)
+            if "choice" in params:
+                raise FastParserError(tag)
+            params["choice"] = value
+        else:
+            raise FastParserError(tag)
+    return GeometryChoice(**params)
+
+
+def _parse_Gloss(elem: etree._Element) -> Gloss:
+    """Parse given element into :class:`Gloss`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Method")
+    if value is not None:
+        params["method"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return Gloss(**params)
+
+
+def _parse_Height(elem: etree._Element) -> Height:
+    """Parse given element into :class:`Height`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Units")
+    if value is not None:
+        params["units"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return Height(**params)
+
+
+def _parse_Illuminant(elem: etree._Element) -> Illuminant:
+    """Parse given element into :class:`Illuminant`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("X")
+    if value is not None:
+        params["x"] = float(value)
+    value = attrib.get("Y")
+    if value is not None:
+        params["y"] = float(value)
+    value = attrib.get("Z")
+    if value is not None:
+        params["z"] = float(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_10)
+    return Illuminant(**params)
+
+
+def _parse_Image(elem: etree._Element) -> Image:
+    """Parse given element into :class:`Image`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Label")
+    if value is not None:
+        params["label"] = sys.intern(value)
+    value = attrib.get("ImageFileName")
+    if value is not None:
+        params["image_file_name"] = value
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_11, format="base64")
+    return Image(**params)
+
+
+def _parse_Length(elem: etree._Element) -> Length:
+    """Parse given element into :class:`Length`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Units")
+    if value is not None:
+        params["units"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return Length(**params)
+
+
+def _parse_LuminanceUnitsType(elem: etree._Element) -> LuminanceUnitsType:
+    """Parse given element into :class:`LuminanceUnitsType`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_12)
+    return LuminanceUnitsType(**params)
+
+
+def _parse_MeasurementSpec(elem: etree._Element) -> MeasurementSpec:
+    """Parse given element into :class:`MeasurementSpec`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}MeasurementType":
+            value = _parse_MeasurementType(child)
+            if "measurement_type" in params:
+                raise FastParserError(tag)
+            params["measurement_type"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}GeometryChoice":
+            value = _parse_GeometryChoice(child)
+            if "geometry_choice" in params:
+                raise FastParserError(tag)
+            params["geometry_choice"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}WavelengthRange":
+            value = _parse_WavelengthRange(child)
+            if "wavelength_range" in params:
+                raise FastParserError(tag)
+            params["wavelength_range"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}LuminanceUnitsType":
+            value = _parse_LuminanceUnitsType(child)
+            if "luminance_units_type" in params:
+                raise FastParserError(tag)
+            params["luminance_units_type"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}CalibrationStandard":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "calibration_standard" in params:
+                raise FastParserError(tag)
+            params["calibration_standard"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Aperture":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "aperture" in params:
+                raise FastParserError(tag)
+            params["aperture"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Backing":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "backing" in params:
+                raise FastParserError(tag)
+            params["backing"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}BandpassCorrected":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else converter.deserialize(text, _TYPES_2)
+            if "bandpass_corrected" in params:
+                raise FastParserError(tag)
+            params["bandpass_corrected"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Device":
+            value = _parse_Device(child)
+            if "device" in params:
+                raise FastParserError(tag)
+            params["device"] = value
+        else:
+            raise FastParserError(tag)
+    return MeasurementSpec(**params)
+
+
+def _parse_MeasurementType(elem: etree._Element) -> MeasurementType:
+    """Parse given element into :class:`MeasurementType`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_13)
+    return MeasurementType(**params)
+
+
+def _parse_Method(elem: etree._Element) -> Method:
+    """Parse given element into :class:`Method`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_14)
+    return Method(**params)
+
+
+def _parse_MultiAngleType(elem: etree._Element) -> MultiAngleType:
+    """Parse given element into :class:`MultiAngleType`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}BRDFAngle":
+            value = _parse_Brdfangle(child)
+            values = params.get("brdfangle")
+            if values is None:
+                params["brdfangle"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return MultiAngleType(**params)
+
+
+def _parse_Object(elem: etree._Element) -> Object:
+    """Parse given element into :class:`Object`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("ObjectType")
+    if value is not None:
+        params["object_type"] = sys.intern(value)
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("Id")
+    if value is not None:
+        params["id"] = value
+    value = attrib.get("GUID")
+    if value is not None:
+        params["guid"] = value
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}CreationDate":
+            value = _parse_CreationDate(child)
+            if "creation_date" in params:
+                raise FastParserError(tag)
+            params["creation_date"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Comment":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "comment" in params:
+                raise FastParserError(tag)
+            params["comment"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}ColorValues":
+            value = _parse_ColorValues(child)
+            if "color_values" in params:
+                raise FastParserError(tag)
+            params["color_values"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}ColorDifferenceValues":
+            value = _parse_ColorDifferenceValues(child)
+            if "color_difference_values" in params:
+                raise FastParserError(tag)
+            params["color_difference_values"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}DeviceColorValues":
+            value = _parse_DeviceColorValues(child)
+            if "device_color_values" in params:
+                raise FastParserError(tag)
+            params["device_color_values"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}TagCollection":
+            value = _parse_TagCollection(child)
+            values = params.get("tag_collection")
+            if values is None:
+                params["tag_collection"] = [value]
+            else:
+                values.append(value)
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}PhysicalAttributes":
+            value = _parse_PhysicalAttributes(child)
+            if "physical_attributes" in params:
+                raise FastParserError(tag)
+            params["physical_attributes"] = value
+        else:
+            raise FastParserError(tag)
+    return Object(**params)
+
+
+def _parse_ObjectCollection(elem: etree._Element) -> ObjectCollection:
+    """Parse given element into :class:`ObjectCollection`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Object":
+            value = _parse_Object(child)
+            values = params.get("object_value")
+            if values is None:
+                params["object_value"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ObjectCollection(**params)
+
+
+def _parse_Observer(elem: etree._Element) -> Observer:
+    """Parse given element into :class:`Observer`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("Angle")
+    if value is not None:
+        params["angle"] = int(value)
+    value = attrib.get("Age")
+    if value is not None:
+        params["age"] = int(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_15)
+    return Observer(**params)
+
+
+def _parse_Opacity(elem: etree._Element) -> Opacity:
+    """Parse given element into :class:`Opacity`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Method")
+    if value is not None:
+        params["method"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return Opacity(**params)
+
+
+def _parse_PhysicalAttributes(elem: etree._Element) -> PhysicalAttributes:
+    """Parse given element into :class:`PhysicalAttributes`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}TargetType":
+            value = _parse_TargetType(child)
+            if "target_type" in params:
+                raise FastParserError(tag)
+            params["target_type"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}FinishType":
+            value = _parse_FinishType(child)
+            if "finish_type" in params:
+                raise FastParserError(tag)
+            params["finish_type"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}SubstrateType":
+            value = _parse_SubstrateType(child)
+            if "substrate_type" in params:
+                raise FastParserError(tag)
+            params["substrate_type"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Quantity":
+            value = _parse_Quantity(child)
+            if "quantity" in params:
+                raise FastParserError(tag)
+            params["quantity"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Height":
+            value = _parse_Height(child)
+            if "height" in params:
+                raise FastParserError(tag)
+            params["height"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Width":
+            value = _parse_Width(child)
+            if "width" in params:
+                raise FastParserError(tag)
+            params["width"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Length":
+            value = _parse_Length(child)
+            if "length" in params:
+                raise FastParserError(tag)
+            params["length"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Thickness":
+            value = _parse_Thickness(child)
+            if "thickness" in params:
+                raise FastParserError(tag)
+            params["thickness"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Gloss":
+            value = _parse_Gloss(child)
+            values = params.get("gloss")
+            if values is None:
+                params["gloss"] = [value]
+            else:
+                values.append(value)
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Opacity":
+            value = _parse_Opacity(child)
+            values = params.get("opacity")
+            if values is None:
+                params["opacity"] = [value]
+            else:
+                values.append(value)
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}CustomAttributeString":
+            value = _parse_CustomAttributeString(child)
+            values = params.get("custom_attribute_string")
+            if values is None:
+                params["custom_attribute_string"] = [value]
+            else:
+                values.append(value)
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}CustomAttributeValue":
+            value = _parse_CustomAttributeValue(child)
+            values = params.get("custom_attribute_value")
+            if values is None:
+                params["custom_attribute_value"] = [value]
+            else:
+                values.append(value)
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Image":
+            value = _parse_Image(child)
+            values = params.get("image")
+            if values is None:
+                params["image"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return PhysicalAttributes(**params)
+
+
+def _parse_PrivateColorValues(elem: etree._Element) -> PrivateColorValues:
+    """Parse given element into :class:`PrivateColorValues`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("KeyID")
+    if value is not None:
+        params["key_id"] = value
+    value = attrib.get("MeasureDate")
+    if value is not None:
+        params["measure_date"] = converter.deserialize(value, _TYPES_3)
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_11, format="base64")
+    return PrivateColorValues(**params)
+
+
+def _parse_PrivateSpectrum(elem: etree._Element) -> PrivateSpectrum:
+    """Parse given element into :class:`PrivateSpectrum`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("KeyID")
+    if value is not None:
+        params["key_id"] = value
+    value = attrib.get("MeasureDate")
+    if value is not None:
+        params["measure_date"] = converter.deserialize(value, _TYPES_3)
+    value = attrib.get("StartWL")
+    if value is not None:
+        params["start_wl"] = int(value)
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_11, format="base64")
+    return PrivateSpectrum(**params)
+
+
+def _parse_Process(elem: etree._Element) -> Process:
+    """Parse given element into :class:`Process`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = text
+    return Process(**params)
+
+
+def _parse_Profile(elem: etree._Element) -> Profile:
+    """Parse given element into :class:`Profile`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Id")
+    if value is not None:
+        params["id"] = value
+    value = attrib.get("Direction")
+    if value is not None:
+        params["direction"] = converter.deserialize(value, _TYPES_16)
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}ProfileChoice":
+            value = _parse_ProfileTypeProfileChoice(child)
+            if "profile_choice" in params:
+                raise FastParserError(tag)
+            params["profile_choice"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Parameters":
+            value = _parse_ProfileTypeParameters(child)
+            values = params.get("parameters")
+            if values is None:
+                params["parameters"] = [value]
+            else:
+                values.append(value)
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Created":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else converter.deserialize(text, _TYPES_3)
+            if "created" in params:
+                raise FastParserError(tag)
+            params["created"] = value
+        else:
+            raise FastParserError(tag)
+    return Profile(**params)
+
+
+def _parse_ProfileCollection(elem: etree._Element) -> ProfileCollection:
+    """Parse given element into :class:`ProfileCollection`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Profile":
+            value = _parse_Profile(child)
+            values = params.get("profile")
+            if values is None:
+                params["profile"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return ProfileCollection(**params)
+
+
+def _parse_ProfileTypeParameters(elem: etree._Element) -> ProfileTypeParameters:
+    """Parse given element into :class:`ProfileTypeParameters`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Name":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "name" in params:
+                raise FastParserError(tag)
+            params["name"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}ValueChoice":
+            value = _parse_ProfileTypeParametersValueChoice(child)
+            if "value_choice" in params:
+                raise FastParserError(tag)
+            params["value_choice"] = value
+        else:
+            raise FastParserError(tag)
+    return ProfileTypeParameters(**params)
+
+
+def _parse_ProfileTypeParametersValueChoice(
+    elem: etree._Element,
+) -> ProfileTypeParametersValueChoice:
+    """Parse given element into :class:`ProfileTypeParametersValueChoice`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}DoubleValue":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "double_value_or_integer_value_or_string_value" in params:
+                raise FastParserError(tag)
+            params["double_value_or_integer_value_or_string_value"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}IntegerValue":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else int(text)
+            if "double_value_or_integer_value_or_string_value" in params:
+                raise FastParserError(tag)
+            params["double_value_or_integer_value_or_string_value"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}StringValue":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "double_value_or_integer_value_or_string_value" in params:
+                raise FastParserError(tag)
+            params["double_value_or_integer_value_or_string_value"] = value
+        else:
+            raise FastParserError(tag)
+    return ProfileTypeParametersValueChoice(**params)
+
+
+def _parse_ProfileTypeProfileChoice(elem: etree._Element) -> ProfileTypeProfileChoice:
+    """Parse given element into :class:`ProfileTypeProfileChoice`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}ProfileFile":
+            value = _parse_ProfileTypeProfileChoiceProfileFile(child)
+            if "profile_file_or_profile_uri" in params:
+                raise FastParserError(tag)
+            params["profile_file_or_profile_uri"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}ProfileURI":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "profile_file_or_profile_uri" in params:
+                raise FastParserError(tag)
+            params["profile_file_or_profile_uri"] = value
+        else:
+            raise FastParserError(tag)
+    return ProfileTypeProfileChoice(**params)
+
+
+def _parse_ProfileTypeProfileChoiceProfileFile(
+    elem: etree._Element,
+) -> ProfileTypeProfileChoiceProfileFile:
+    """Parse given element into :class:`ProfileTypeProfileChoiceProfileFile`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("ProfileName")
+    if value is not None:
+        params["profile_name"] = value
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_11, format="base64")
+    return ProfileTypeProfileChoiceProfileFile(**params)
+
+
+def _parse_Quantity(elem: etree._Element) -> Quantity:
+    """Parse given element into :class:`Quantity`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Units")
+    if value is not None:
+        params["units"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return Quantity(**params)
+
+
+def _parse_ReflectanceSpectrum(elem: etree._Element) -> ReflectanceSpectrum:
+    """Parse given element into :class:`ReflectanceSpectrum`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("MeasureDate")
+    if value is not None:
+        params["measure_date"] = converter.deserialize(value, _TYPES_3)
+    value = attrib.get("StartWL")
+    if value is not None:
+        params["start_wl"] = int(value)
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = list(map(float, text.split()))
+    return ReflectanceSpectrum(**params)
+
+
+def _parse_Resources(elem: etree._Element) -> Resources:
+    """Parse given element into :class:`Resources`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}ObjectCollection":
+            value = _parse_ObjectCollection(child)
+            if "object_collection" in params:
+                raise FastParserError(tag)
+            params["object_collection"] = value
+        elif (
+            tag
+            == "{http://colorexchangeformat.com/CxF3-core}ColorSpecificationCollection"
+        ):
+            value = _parse_ColorSpecificationCollection(child)
+            if "color_specification_collection" in params:
+                raise FastParserError(tag)
+            params["color_specification_collection"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}ProfileCollection":
+            value = _parse_ProfileCollection(child)
+            if "profile_collection" in params:
+                raise FastParserError(tag)
+            params["profile_collection"] = value
+        else:
+            raise FastParserError(tag)
+    return Resources(**params)
+
+
+def _parse_SingleAngleConfiguration(elem: etree._Element) -> SingleAngleConfiguration:
+    """Parse given element into :class:`SingleAngleConfiguration`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_17)
+    return SingleAngleConfiguration(**params)
+
+
+def _parse_SingleAngleType(elem: etree._Element) -> SingleAngleType:
+    """Parse given element into :class:`SingleAngleType`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}SingleAngleConfiguration":
+            value = _parse_SingleAngleConfiguration(child)
+            if "single_angle_configuration" in params:
+                raise FastParserError(tag)
+            params["single_angle_configuration"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}IlluminationAngle":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "illumination_angle" in params:
+                raise FastParserError(tag)
+            params["illumination_angle"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}MeasurementAngle":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "measurement_angle" in params:
+                raise FastParserError(tag)
+            params["measurement_angle"] = value
+        else:
+            raise FastParserError(tag)
+    return SingleAngleType(**params)
+
+
+def _parse_SpectralPoint(elem: etree._Element) -> SpectralPoint:
+    """Parse given element into :class:`SpectralPoint`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("WL")
+    if value is not None:
+        params["wl"] = float(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return SpectralPoint(**params)
+
+
+def _parse_SpotColorType(elem: etree._Element) -> SpotColorType:
+    """Parse given element into :class:`SpotColorType`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Name":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else text
+            if "name" in params:
+                raise FastParserError(tag)
+            params["name"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Percentage":
+            if len(child):
+                raise FastParserError(tag)
+            text = child.text
+            value = "" if text is None else float(text)
+            if "percentage" in params:
+                raise FastParserError(tag)
+            params["percentage"] = value
+        else:
+            raise FastParserError(tag)
+    return SpotColorType(**params)
+
+
+def _parse_Substrate(elem: etree._Element) -> Substrate:
+    """Parse given element into :class:`Substrate`."""
+
+    params = {}
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = text
+    return Substrate(**params)
+
+
+def _parse_SubstrateType(elem: etree._Element) -> SubstrateType:
+    """Parse given element into :class:`SubstrateType`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("OtherType")
+    if value is not None:
+        params["other_type"] = value
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_18)
+    return SubstrateType(**params)
+
+
+def _parse_Tag(elem: etree._Element) -> Tag:
+    """Parse given element into :class:`Tag`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("Value")
+    if value is not None:
+        params["value"] = value
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    return Tag(**params)
+
+
+def _parse_TagCollection(elem: etree._Element) -> TagCollection:
+    """Parse given element into :class:`TagCollection`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    for child in elem.iterchildren():
+        tag = child.tag
+        if tag == "{http://colorexchangeformat.com/CxF3-core}Tag":
+            value = _parse_Tag(child)
+            values = params.get("tag")
+            if values is None:
+                params["tag"] = [value]
+            else:
+                values.append(value)
+        else:
+            raise FastParserError(tag)
+    return TagCollection(**params)
+
+
+def _parse_TargetType(elem: etree._Element) -> TargetType:
+    """Parse given element into :class:`TargetType`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("OtherType")
+    if value is not None:
+        params["other_type"] = value
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = converter.deserialize(text, _TYPES_19)
+    return TargetType(**params)
+
+
+def _parse_Thickness(elem: etree._Element) -> Thickness:
+    """Parse given element into :class:`Thickness`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Units")
+    if value is not None:
+        params["units"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return Thickness(**params)
+
+
+def _parse_TransmittanceSpectrum(elem: etree._Element) -> TransmittanceSpectrum:
+    """Parse given element into :class:`TransmittanceSpectrum`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Name")
+    if value is not None:
+        params["name"] = value
+    value = attrib.get("MeasureDate")
+    if value is not None:
+        params["measure_date"] = converter.deserialize(value, _TYPES_3)
+    value = attrib.get("StartWL")
+    if value is not None:
+        params["start_wl"] = int(value)
+    value = attrib.get("ColorSpecification")
+    if value is not None:
+        params["color_specification"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = list(map(float, text.split()))
+    return TransmittanceSpectrum(**params)
+
+
+def _parse_TristimulusSpec(elem: etree._Element) -> TristimulusSpec:
+    """Parse given element into :class:`TristimulusSpec`."""
+
+    params = {}
+    for child in elem.iterchildren():
+        tag = child.tag
+        if (parse := _CHOICES_3.get(tag)) is not None:
+            value = parse(child)
+            if "illuminant_or_custom_illuminant" in params:
+                raise FastParserError(tag)
+            params["illuminant_or_custom_illuminant"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Observer":
+            value = _parse_Observer(child)
+            if "observer" in params:
+                raise FastParserError(tag)
+            params["observer"] = value
+        elif tag == "{http://colorexchangeformat.com/CxF3-core}Method":
+            value = _parse_Method(child)
+            if "method" in params:
+                raise FastParserError(tag)
+            params["method"] = value
+        else:
+            raise FastParserError(tag)
+    return TristimulusSpec(**params)
+
+
+def _parse_WavelengthRange(elem: etree._Element) -> WavelengthRange:
+    """Parse given element into :class:`WavelengthRange`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("StartWL")
+    if value is not None:
+        params["start_wl"] = int(value)
+    value = attrib.get("Increment")
+    if value is not None:
+        params["increment"] = int(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    return WavelengthRange(**params)
+
+
+def _parse_Width(elem: etree._Element) -> Width:
+    """Parse given element into :class:`Width`."""
+
+    params = {}
+    attrib = elem.attrib
+    value = attrib.get("Units")
+    if value is not None:
+        params["units"] = sys.intern(value)
+    if len(elem):
+        raise FastParserError(elem[0].tag)
+    text = elem.text
+    if text is not None:
+        params["value"] = float(text)
+    return Width(**params)
+
+
+_CHOICES_0 = {
+    "{http://colorexchangeformat.com/CxF3-core}DeltaCIELab": _parse_DeltaCielab,
+    "{http://colorexchangeformat.com/CxF3-core}DeltaCustom": _parse_DeltaCustom,
+}
+
+_CHOICES_1 = {
+    "{http://colorexchangeformat.com/CxF3-core}ReflectanceSpectrum": _parse_ReflectanceSpectrum,
+    "{http://colorexchangeformat.com/CxF3-core}TransmittanceSpectrum": _parse_TransmittanceSpectrum,
+    "{http://colorexchangeformat.com/CxF3-core}EmissiveSpectrum": _parse_EmissiveSpectrum,
+    "{http://colorexchangeformat.com/CxF3-core}CustomSpectrum": _parse_CustomSpectrum,
+    "{http://colorexchangeformat.com/CxF3-core}ColorSRGB": _parse_ColorSrgb,
+    "{http://colorexchangeformat.com/CxF3-core}ColorAdobeRGB": _parse_ColorAdobeRgb,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCIELab": _parse_ColorCielab,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCIELCh": _parse_ColorCielch,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCIEXYZ": _parse_ColorCiexyz,
+    "{http://colorexchangeformat.com/CxF3-core}ColorEmissiveCIEXYZ": _parse_ColorEmissiveCiexyz,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCIExyY": _parse_ColorCiexyY,
+    "{http://colorexchangeformat.com/CxF3-core}ColorEmissiveCIExyY": _parse_ColorEmissiveCiexyY,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCIELuv": _parse_ColorCieluv,
+    "{http://colorexchangeformat.com/CxF3-core}ColorDensity": _parse_ColorDensity,
+    "{http://colorexchangeformat.com/CxF3-core}PrivateSpectrum": _parse_PrivateSpectrum,
+    "{http://colorexchangeformat.com/CxF3-core}PrivateColorValues": _parse_PrivateColorValues,
+    "{http://colorexchangeformat.com/CxF3-core}CustomColorSpace": _parse_CustomColorSpace,
+}
+
+_CHOICES_2 = {
+    "{http://colorexchangeformat.com/CxF3-core}ColorHTML": _parse_ColorHtml,
+    "{http://colorexchangeformat.com/CxF3-core}ColorNotation": _parse_ColorNotation,
+    "{http://colorexchangeformat.com/CxF3-core}ColorRGB": _parse_ColorRgb,
+    "{http://colorexchangeformat.com/CxF3-core}ColorHSL": _parse_ColorHsl,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCMYK": _parse_ColorCmyk,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCMYKPlusN": _parse_ColorCmykplusN,
+    "{http://colorexchangeformat.com/CxF3-core}ColorCustom": _parse_ColorCustom,
+    "{http://colorexchangeformat.com/CxF3-core}ColorPantoneHexachrome": _parse_ColorPantoneHexachrome,
+    "{http://colorexchangeformat.com/CxF3-core}ColorRecipe": _parse_ColorRecipe,
+    "{http://colorexchangeformat.com/CxF3-core}PrivateColorValues": _parse_PrivateColorValues,
+}
+
+_CHOICES_3 = {
+    "{http://colorexchangeformat.com/CxF3-core}Illuminant": _parse_Illuminant,
+    "{http://colorexchangeformat.com/CxF3-core}CustomIlluminant": _parse_CustomIlluminant,
+}
+
+
+def parse_cxf(root: etree._Element) -> CxF:
+    """
+    Parse given *CxF* root element into a :class:`colour_cxf.cxf3.CxF` instance.
+
+    Parameters
+    ----------
+    root
+        Root element of the *CxF* document.
+
+    Returns
+    -------
+    :class:`colour_cxf.cxf3.CxF`
+        Parsed *CxF* document.
+
+    Raises
+    ------
+    FastParserError
+        If the document uses constructs that only the generic *xsdata* parser
+        supports, e.g., unknown elements or type substitutions.
+    """
+
+    if root.tag != "{http://colorexchangeformat.com/CxF3-core}CxF" or _XSI_ATTRIBUTES(
+        root
+    ):
+        raise FastParserError(root.tag)
+
+    return _parse_CxF(root)
+
+
+OBJECT_TAG = "{http://colorexchangeformat.com/CxF3-core}Object"
+"""
+Tag of the *CxF* objects, the :func:`lxml.etree.iterparse` events given to
+:func:`parse_cxf_events` must be filtered with it.
+"""
+
+
+def parse_cxf_events(events: etree.iterparse) -> CxF:
+    """
+    Parse given *CxF* incremental parsing events into a
+    :class:`colour_cxf.cxf3.CxF` instance.
+
+    Each object is bound as soon as its end event is received and its element
+    is then discarded, thus the whole document tree is never held in memory.
+
+    Parameters
+    ----------
+    events
+        :func:`lxml.etree.iterparse` iterator yielding the *end* events of the
+        :attr:`OBJECT_TAG` elements.
+
+    Returns
+    -------
+    :class:`colour_cxf.cxf3.CxF`
+        Parsed *CxF* document.
+
+    Raises
+    ------
+    FastParserError
+        If the document uses constructs that only the generic *xsdata* parser
+        supports, e.g., unknown elements or type substitutions.
+    """
+
+    objects = []
+    collection = None
+    for _event, elem in events:
+        parent = elem.getparent()
+        if collection is None:
+            collection = parent
+
+        if parent is None or parent is not collection or _XSI_ATTRIBUTES(elem):
+            raise FastParserError(elem.tag)
+
+        objects.append(_parse_Object(elem))
+
+        # The previous objects have been bound, their elements can be safely
+        # deleted while parsing.
+        elem.clear()
+        while (previous := elem.getprevious()) is not None:
+            if previous.tag != OBJECT_TAG:
+                raise FastParserError(previous.tag)
+
+            parent.remove(previous)
+
+    root = events.root
+    if root is None:
+        raise FastParserError(None)
+
+    if collection is not None:
+        resources = collection.getparent()
+        if (
+            collection.tag
+            != "{http://colorexchangeformat.com/CxF3-core}ObjectCollection"
+            or resources is None
+            or resources.tag != "{http://colorexchangeformat.com/CxF3-core}Resources"
+            or resources.getparent() is not root
+        ):
+            raise FastParserError(collection.tag)
+
+        for elem in collection.findall(OBJECT_TAG):
+            collection.remove(elem)
+
+    cxf = parse_cxf(root)
+    if objects and cxf.resources is not None:
+        object_collection = cxf.resources.object_collection
+        if object_collection is not None:
+            object_collection.object_value = objects
+
+    return cxf
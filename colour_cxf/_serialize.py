@@ -0,0 +1,64 @@
+"""
+Serializer
+==========
+
+Define the *xsdata* serializer used to write :mod:`colour_cxf.cxf3` data
+classes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from xsdata.formats.dataclass.serializers import XmlSerializer
+
+if TYPE_CHECKING:
+    from xsdata.formats.dataclass.models.elements import XmlVar
+
+__all__ = [
+    "CxFSerializer",
+]
+
+
+class CxFSerializer(XmlSerializer):
+    """
+    Define an *xsdata* serializer formatting float token lists, e.g., spectral
+    values, in a single pass.
+
+    The generic serializer converts each token through the converter factory,
+    twice, before joining them. Lists of finite floats in positional notation
+    produce the same output with :func:`repr` and a single :meth:`str.join`
+    call, other lists go through the generic path.
+    """
+
+    @classmethod
+    def encode_primitive(cls, value: Any, var: XmlVar) -> Any:
+        """
+        Encode given value for *XML* serialization.
+
+        Parameters
+        ----------
+        value
+            Value to encode.
+        var
+            Field metadata.
+
+        Returns
+        -------
+        :class:`object`
+            Encoded value.
+        """
+
+        if (
+            var is not None
+            and var.tokens
+            and type(value) is list
+            and set(map(type, value)) == {float}
+        ):
+            text = " ".join(map(repr, value))
+            # Exponents and non-finite values, i.e., "inf" and "nan", need the
+            # converter formatting, e.g., "1E-05" or "INF".
+            if "e" not in text and "n" not in text:
+                return text
+
+        return super().encode_primitive(value, var)
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorCieluv:
     """ColorSpace type that holds CIELuv values.
 
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.spot_color_type import SpotColorType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorCmykplusN:
     """ColorSpace type that holds CMYKn values.
 
@@ -14,7 +14,7 @@ from colour_cxf.cxf3.edensity_status_type import EdensityStatusType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorDensity:
     """Color Value Type used to represent a particular density status and filter.
 
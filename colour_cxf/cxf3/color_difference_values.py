@@ -14,7 +14,7 @@ from colour_cxf.cxf3.delta_custom import DeltaCustom
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorDifferenceValues:
     """
     CIELab Color difference values compared to the referenced standard.
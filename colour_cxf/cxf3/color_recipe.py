@@ -17,7 +17,7 @@ from colour_cxf.cxf3.tag import Tag
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorRecipe:
     """
     An element which contains a recipe(formula) consisting primarily of a list of
@@ -15,7 +15,7 @@ from colour_cxf.cxf3.tristimulus_spec import TristimulusSpec
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorSpecification:
     """
     ID reference to the colorSpecification that describes this colorvalue
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.color_specification import ColorSpecification
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorSpecificationCollection:
     """
     Collection of all color specifications within the CXF file.
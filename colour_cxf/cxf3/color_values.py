@@ -29,7 +29,7 @@ from colour_cxf.cxf3.transmittance_spectrum import TransmittanceSpectrum
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorValues:
     """
     Normal colorspace values such as spectral data, CIELab, XYZ.
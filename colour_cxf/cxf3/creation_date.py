@@ -13,7 +13,7 @@ from xsdata.models.datatype import XmlDateTime
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class CreationDate:
     """
     Creation date of object, specified as universal time format with time zone.
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.custom_data_type import CustomDataType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomColorSpace:
     """
     Color Space type that holds Custom color space values.
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.spectral_point import SpectralPoint
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomIlluminant:
     """
     Custom Illuminant data containing name and spectral power distribution.
@@ -15,7 +15,7 @@ from colour_cxf.cxf3.spectral_point import SpectralPoint
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomSpectrum:
     """Color Value type used to represent individual spectral data points without
     any specific number or increment.
@@ -15,7 +15,7 @@ from colour_cxf.cxf3.resources import Resources
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class CxF:
     """
     Root element of CXF.
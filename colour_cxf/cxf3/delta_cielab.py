@@ -15,7 +15,7 @@ from colour_cxf.cxf3.decmc_type import DecmcType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeltaCielab:
     """
     Color Difference type that holds CIELab color difference (Delta) values.
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.custom_delta_type import CustomDeltaType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeltaCustom:
     """
     Color Difference type that holds Custom color difference (Delta) values.
@@ -15,7 +15,7 @@ from colour_cxf.cxf3.device_illumination import DeviceIllumination
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """
     Element containing information about the measurement device from which the
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.edevice_class_type import EdeviceClassType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClass:
     """
     Measurement device type, such as spot, scanning, etc.
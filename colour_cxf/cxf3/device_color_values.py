@@ -22,7 +22,7 @@ from colour_cxf.cxf3.private_color_values import PrivateColorValues
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceColorValues:
     """
     Device dependent colorspace values such as RGB, CMYK, etc.
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.device_filter_type import DeviceFilterType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceFilter(DeviceFilterType):
     """
     Enumerated UV Filter used by device and an optional filterposition (% of filter
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.efilter_type import EfilterType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceFilterType:
     """
     Type of UV filter employed and an optional string attribute describing any
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.edevice_illumination_type import EdeviceIlluminationType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceIllumination:
     """
     Enumerated type of illumination used by the measuring device (M0-M3,, LED,
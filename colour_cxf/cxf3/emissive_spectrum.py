@@ -13,7 +13,7 @@ from xsdata.models.datatype import XmlDateTime
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class EmissiveSpectrum:
     """Color Value type used to represent spectral data collected in an emissive
     mode from a self illuminated object (also known as "spectral radiance" ).
@@ -14,7 +14,7 @@ from colour_cxf.cxf3.tag import Tag
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInformation:
     """
     Optional header section containing CXF File Information.
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.efinish_type import EfinishType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class FinishType:
     """
     Enumeration of finish type (matte, polished, glossy, etc.).
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.geometry_choice_type import GeometryChoiceType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class GeometryChoice(GeometryChoiceType):
     """
     Enumerated choice of geometries (sphere, single angle, multiangle)
@@ -16,7 +16,7 @@ from colour_cxf.cxf3.single_angle_type import SingleAngleType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class GeometryChoiceType:
     """
     Specification of the device geometry, i.e. Sphere included/excluded or single
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.eilluminant_type import EilluminantType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Illuminant:
     """Enumeration of CIE illuminant used in calculating colorimetric data from
     spectral data.
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.image_type import ImageType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(ImageType):
     """
     A binary object containing a normal image file (example jpg image).
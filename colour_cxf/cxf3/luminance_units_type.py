@@ -13,7 +13,7 @@ from colour_cxf.cxf3.eluminance_units import EluminanceUnits
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class LuminanceUnitsType:
     """Units that the measurements are based on.
 
@@ -17,7 +17,7 @@ from colour_cxf.cxf3.wavelength_range import WavelengthRange
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class MeasurementSpec:
     """
     Portion of the colorspecification which contains information related to how
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.espectrum_type import EspectrumType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class MeasurementType:
     """
     Type of measurement (Spectral_Reflectance, Spectral_Transmittance,
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.eastm_table_type import EastmTableType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Method:
     """
     ASTM Table (5 or 6) or other method (1 nm interpolation) used to calculate XYZ
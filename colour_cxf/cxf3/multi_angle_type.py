@@ -13,7 +13,7 @@ from colour_cxf.cxf3.brdfangle import Brdfangle
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiAngleType:
     """
     Geometry type where multiple measurements are obtained at different
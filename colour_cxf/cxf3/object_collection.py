@@ -13,7 +13,7 @@ from colour_cxf.cxf3.object_mod import Object
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectCollection:
     """
     CXF Resource Element that contains ALL of the objects(and their colorspace
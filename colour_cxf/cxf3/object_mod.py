@@ -18,7 +18,7 @@ from colour_cxf.cxf3.tag_collection import TagCollection
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Object:
     """
     The CxF representation for the physical (or conceptual) object which has color
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.eobserver_type import EobserverType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Observer:
     """Enumeration of observer database used (2 degree or 10 degree).
 
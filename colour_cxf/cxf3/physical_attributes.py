@@ -25,7 +25,7 @@ from colour_cxf.cxf3.width import Width
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicalAttributes:
     """
     Object element that contains information regarding physical attributes of the
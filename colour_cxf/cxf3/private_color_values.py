@@ -13,7 +13,7 @@ from xsdata.models.datatype import XmlDateTime
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivateColorValues:
     """
     Color Value type used to represent private color value data generally protected
@@ -13,7 +13,7 @@ from xsdata.models.datatype import XmlDateTime
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivateSpectrum:
     """
     Color Value type used to represent private spectral data generally protected
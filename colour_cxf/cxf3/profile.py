@@ -13,7 +13,7 @@ from colour_cxf.cxf3.profile_type import ProfileType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile(ProfileType):
     """
     A binary object containing a type of profile generally used to transform
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.profile import Profile
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileCollection:
     """
     CXF Element that can contain multiple profiles that may be referenced by the
@@ -19,7 +19,7 @@ from colour_cxf.cxf3.profile_type_profile_choice import (
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileType:
     """
     Type representing a profile with optional profile input parameters and creation
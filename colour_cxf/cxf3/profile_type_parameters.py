@@ -15,7 +15,7 @@ from colour_cxf.cxf3.profile_type_parameters_value_choice import (
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileTypeParameters:
     class Meta:
         global_type = False
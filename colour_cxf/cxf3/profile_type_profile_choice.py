@@ -15,7 +15,7 @@ from colour_cxf.cxf3.profile_type_profile_choice_profile_file import (
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileTypeProfileChoice:
     class Meta:
         global_type = False
@@ -13,7 +13,7 @@ from xsdata.models.datatype import XmlDateTime
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectanceSpectrum:
     """
     Color Value type used to represent the spectral data reflected from an
@@ -17,7 +17,7 @@ from colour_cxf.cxf3.profile_collection import ProfileCollection
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class Resources:
     """
     CXF element containng all core resources.
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class SerialNumber:
     """
     Serial number of the measuring spectrophotometer if specified.
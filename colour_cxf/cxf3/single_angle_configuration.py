@@ -15,7 +15,7 @@ from colour_cxf.cxf3.esingle_angle_configuration_type import (
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class SingleAngleConfiguration:
     """Enumerated Type of single angle geometry.
 
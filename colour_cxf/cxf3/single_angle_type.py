@@ -13,7 +13,7 @@ from colour_cxf.cxf3.single_angle_configuration import SingleAngleConfiguration
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class SingleAngleType:
     """
     Geometry type where measurement is based on a single angle (example 45/0).
@@ -13,7 +13,7 @@ from colour_cxf.cxf3.esubstrate_type import EsubstrateType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubstrateType:
     """
     Enumeration of substrate type (wood, paper, textile, etc.).
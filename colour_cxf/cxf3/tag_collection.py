@@ -13,7 +13,7 @@ from colour_cxf.cxf3.tag import Tag
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class TagCollection:
     """A named collection of tag/value pairs.
 
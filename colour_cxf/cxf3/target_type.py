@@ -13,7 +13,7 @@ from colour_cxf.cxf3.etarget_type import EtargetType
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetType:
     """
     Standard target types, such as IT8.7/3, etc.
@@ -13,7 +13,7 @@ from xsdata.models.datatype import XmlDateTime
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransmittanceSpectrum:
     """Color Value type used to represent spectral data collected in a transmission mode - ie: light transmitted through an object relative to the amount transmitted through the blank medium.(Percent Transmittance).
 
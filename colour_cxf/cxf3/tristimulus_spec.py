@@ -16,7 +16,7 @@ from colour_cxf.cxf3.observer import Observer
 __NAMESPACE__ = "http://colorexchangeformat.com/CxF3-core"
 
 
-@dataclass
+@dataclass(slots=True)
 class TristimulusSpec:
     """
     Portion of the colorspecification which contains information related to how
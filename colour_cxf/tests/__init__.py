@@ -0,0 +1,15 @@
+"""
+Tests
+=====
+
+Define the objects shared by the :mod:`colour_cxf` unit tests.
+"""
+
+from pathlib import Path
+
+__all__ = [
+    "RESOURCES_DIRECTORY",
+]
+
+RESOURCES_DIRECTORY = Path(__file__).parent / "resources"
+"""Directory containing the CxF test documents."""
@@ -13,6 +13,8 @@ from lxml_asserts.testcase import LxmlTestCaseMixin
 
 import colour_cxf.cxf3
 from colour_cxf import read_cxf_from_file
+from colour_cxf.cxf3 import ColorCielab, ColorSrgb, ReflectanceSpectrum
+from colour_cxf.tests import RESOURCES_DIRECTORY
 
 
 class SampleCxfTests(unittest.TestCase, LxmlTestCaseMixin):
@@ -21,13 +23,17 @@ class SampleCxfTests(unittest.TestCase, LxmlTestCaseMixin):
     provided in the :mod:`colour_cxf` module.
     """
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.sample_file_path = "colour_cxf/tests/resources/sample.cxf"
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test fixtures shared by the test methods."""
+        cls.sample_file_path = RESOURCES_DIRECTORY / "sample.cxf"
+
+        # Parse the sample file once, the test methods share the result
+        cls.sample_cxf = read_cxf_from_file(cls.sample_file_path)
 
     def test_sample_file_structure(self) -> None:
         """Test that the sample.cxf file has expected structure and content."""
-        cxf = read_cxf_from_file(self.sample_file_path)
+        cxf = self.sample_cxf
 
         # Verify basic structure
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
@@ -51,7 +57,7 @@ class SampleCxfTests(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_sample_file_objects(self) -> None:
         """Test that the sample.cxf file contains expected objects."""
-        cxf = read_cxf_from_file(self.sample_file_path)
+        cxf = self.sample_cxf
 
         resources = cxf.resources
         assert resources is not None
@@ -71,7 +77,7 @@ class SampleCxfTests(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_sample_file_color_specifications(self) -> None:
         """Test that the sample.cxf file contains expected color specifications."""
-        cxf = read_cxf_from_file(self.sample_file_path)
+        cxf = self.sample_cxf
 
         resources = cxf.resources
         assert resources is not None
@@ -89,63 +95,53 @@ class SampleCxfTests(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_sample_file_spectral_data(self) -> None:
         """Test that the sample.cxf file contains spectral data."""
-        cxf = read_cxf_from_file(self.sample_file_path)
+        cxf = self.sample_cxf
 
         # Find an object with spectral data
-        resources = cxf.resources
-        assert resources is not None
-        assert resources.object_collection is not None
-        objects = resources.object_collection.object_value
-        spectral_found = False
-
-        for obj in objects:
-            if obj.color_values:
-                from colour_cxf.cxf3.reflectance_spectrum import ReflectanceSpectrum
-
-                for color_value in obj.color_values.choice:
-                    if isinstance(color_value, ReflectanceSpectrum):
-                        spectral_found = True
-                        self.assertIsNotNone(color_value.start_wl)
-                        self.assertIsNotNone(color_value.color_specification)
-                        break
-                if spectral_found:
-                    break
+        spectra = self.color_values_by_type(cxf).get(ReflectanceSpectrum)
+        self.assertTrue(spectra, "Sample file should contain spectral data")
+        assert spectra is not None
 
-        self.assertTrue(spectral_found, "Sample file should contain spectral data")
+        spectrum = spectra[0]
+        self.assertIsNotNone(spectrum.start_wl)
+        self.assertIsNotNone(spectrum.color_specification)
 
     def test_sample_file_color_values(self) -> None:
         """Test that the sample.cxf file contains various color values."""
-        cxf = read_cxf_from_file(self.sample_file_path)
+        cxf = self.sample_cxf
+
+        color_values = self.color_values_by_type(cxf)
+
+        # Check for CIELab values
+        cielab_values = color_values.get(ColorCielab)
+        self.assertTrue(cielab_values, "Sample file should contain CIELab color values")
+        assert cielab_values is not None
+        self.assertIsNotNone(cielab_values[0].l)
+        self.assertIsNotNone(cielab_values[0].a)
+        self.assertIsNotNone(cielab_values[0].b)
+
+        # Check for sRGB values
+        srgb_values = color_values.get(ColorSrgb)
+        self.assertTrue(srgb_values, "Sample file should contain sRGB color values")
+        assert srgb_values is not None
+        self.assertIsNotNone(srgb_values[0].r)
+        self.assertIsNotNone(srgb_values[0].g)
+        self.assertIsNotNone(srgb_values[0].b)
+
+    @staticmethod
+    def color_values_by_type(cxf: colour_cxf.cxf3.CxF) -> dict[type, list]:
+        """
+        Group the color values of all the objects by type in a single pass.
+        """
 
         resources = cxf.resources
         assert resources is not None
         assert resources.object_collection is not None
-        objects = resources.object_collection.object_value
 
-        # Check for CIELab values
-        cielab_found = False
-        srgb_found = False
-
-        for obj in objects:
+        color_values: dict[type, list] = {}
+        for obj in resources.object_collection.object_value:
             if obj.color_values:
-                from colour_cxf.cxf3.color_cielab import ColorCielab
-                from colour_cxf.cxf3.color_srgb import ColorSrgb
-
                 for color_value in obj.color_values.choice:
-                    if isinstance(color_value, ColorCielab):
-                        cielab_found = True
-                        self.assertIsNotNone(color_value.l)
-                        self.assertIsNotNone(color_value.a)
-                        self.assertIsNotNone(color_value.b)
-
-                    if isinstance(color_value, ColorSrgb):
-                        srgb_found = True
-                        self.assertIsNotNone(color_value.r)
-                        self.assertIsNotNone(color_value.g)
-                        self.assertIsNotNone(color_value.b)
-
-                if cielab_found and srgb_found:
-                    break
-
-        self.assertTrue(cielab_found, "Sample file should contain CIELab color values")
-        self.assertTrue(srgb_found, "Sample file should contain sRGB color values")
+                    color_values.setdefault(type(color_value), []).append(color_value)
+
+        return color_values
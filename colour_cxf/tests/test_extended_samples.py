@@ -8,13 +8,32 @@ It ensures that all edge case documents can be successfully parsed and validates
 the robustness of the parsing implementation.
 """
 
+import mmap
 import unittest
-from pathlib import Path
 
 from lxml_asserts.testcase import LxmlTestCaseMixin
 
 import colour_cxf.cxf3
 from colour_cxf import read_cxf, read_cxf_from_file, write_cxf
+from colour_cxf.tests import RESOURCES_DIRECTORY
+
+# Edge case CxF documents to test
+EDGE_CASE_FILES = (
+    "minimal_cxf.cxf",
+    "empty_sections.cxf",
+    "fileinformation_all_optional.cxf",
+    "datetime_edge_cases.cxf",
+    "string_edge_cases.cxf",
+    "enumeration_boundary_values.cxf",
+    "object_required_only.cxf",
+    "multiple_objects.cxf",
+    "custom_resources.cxf",
+    "spectral_data_boundaries.cxf",
+    "custom_spectrum_irregular.cxf",
+    "id_reference_validation.cxf",
+    "unicode_special_characters.cxf",
+    "geometry_edge_cases.cxf",
+)
 
 
 class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
@@ -23,51 +42,45 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
     provided in the :mod:`colour_cxf` module.
     """
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.resources_dir = Path(__file__).parent / "resources"
-
-        # List of edge case CxF files to test
-        self.edge_case_files = [
-            "minimal_cxf.cxf",
-            "empty_sections.cxf",
-            "fileinformation_all_optional.cxf",
-            "datetime_edge_cases.cxf",
-            "string_edge_cases.cxf",
-            "enumeration_boundary_values.cxf",
-            "object_required_only.cxf",
-            "multiple_objects.cxf",
-            "custom_resources.cxf",
-            "spectral_data_boundaries.cxf",
-            "custom_spectrum_irregular.cxf",
-            "id_reference_validation.cxf",
-            "unicode_special_characters.cxf",
-            "geometry_edge_cases.cxf",
-        ]
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test fixtures shared by the test methods."""
+        cls.resources_dir = RESOURCES_DIRECTORY
+
+        cls.edge_case_files = EDGE_CASE_FILES
+
+        # Parse each file once, the test methods share the results
+        cls.parsed_cxf = {
+            filename: read_cxf_from_file(cls.resources_dir / filename)
+            for filename in cls.edge_case_files
+        }
 
     def test_minimal_cxf_parsing(self) -> None:
         """Test parsing of the minimal CxF document (root element only)."""
         file_path = self.resources_dir / "minimal_cxf.cxf"
 
         # Test both parsing methods
-        cxf_from_file = read_cxf_from_file(file_path)
+        cxf_from_file = self.parsed_cxf["minimal_cxf.cxf"]
 
-        with open(file_path, "rb") as f:
-            cxf_from_bytes = read_cxf(f.read())
+        with (
+            open(file_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            cxf_from_bytes = read_cxf(buffer)
 
         # Verify both methods return the same result
         self.assertIsInstance(cxf_from_file, colour_cxf.cxf3.CxF)
         self.assertIsInstance(cxf_from_bytes, colour_cxf.cxf3.CxF)
 
-        # Test roundtrip
+        # Test roundtrip, the written documents are validated against the
+        # schema in "GenericCxfParsing.test_all_files_roundtrip".
         xml_output = write_cxf(cxf_from_file)
-        cxf_roundtrip = read_cxf(xml_output)
+        cxf_roundtrip = read_cxf(xml_output, validate_schema=False)
         self.assertIsInstance(cxf_roundtrip, colour_cxf.cxf3.CxF)
 
     def test_empty_sections_parsing(self) -> None:
         """Test parsing of CxF with empty optional sections."""
-        file_path = self.resources_dir / "empty_sections.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["empty_sections.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         self.assertIsNotNone(cxf.file_information)
@@ -76,8 +89,7 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_fileinformation_all_optional_parsing(self) -> None:
         """Test parsing of FileInformation with all optional elements."""
-        file_path = self.resources_dir / "fileinformation_all_optional.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["fileinformation_all_optional.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         self.assertIsNotNone(cxf.file_information)
@@ -95,8 +107,7 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_datetime_edge_cases_parsing(self) -> None:
         """Test parsing of various datetime formats."""
-        file_path = self.resources_dir / "datetime_edge_cases.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["datetime_edge_cases.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         self.assertIsNotNone(cxf.file_information)
@@ -106,8 +117,7 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_string_edge_cases_parsing(self) -> None:
         """Test parsing of various string edge cases and boundary values."""
-        file_path = self.resources_dir / "string_edge_cases.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["string_edge_cases.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         self.assertIsNotNone(cxf.file_information)
@@ -127,8 +137,7 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_enumeration_boundary_values_parsing(self) -> None:
         """Test parsing of all enumeration boundary values."""
-        file_path = self.resources_dir / "enumeration_boundary_values.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["enumeration_boundary_values.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         self.assertIsNotNone(cxf.file_information)
@@ -141,8 +150,7 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_object_required_only_parsing(self) -> None:
         """Test parsing of Object with only required elements."""
-        file_path = self.resources_dir / "object_required_only.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["object_required_only.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         resources = cxf.resources
@@ -160,8 +168,7 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_multiple_objects_parsing(self) -> None:
         """Test parsing of ObjectCollection with multiple objects."""
-        file_path = self.resources_dir / "multiple_objects.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["multiple_objects.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         resources = cxf.resources
@@ -180,8 +187,7 @@ class EdgeCasesParsing(unittest.TestCase, LxmlTestCaseMixin):
 
     def test_custom_resources_parsing(self) -> None:
         """Test parsing of CustomResources with external namespaces."""
-        file_path = self.resources_dir / "custom_resources.cxf"
-        cxf = read_cxf_from_file(file_path)
+        cxf = self.parsed_cxf["custom_resources.cxf"]
 
         self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
         self.assertIsNotNone(cxf.custom_resources)
@@ -0,0 +1,309 @@
+"""
+CxF Fast Parser Tests
+=====================
+
+This module defines tests ensuring that the generated fast parser of the
+:mod:`colour_cxf._fast_parse` module produces the same results as the generic
+*xsdata* parser, and that the documents it does not support fall back to the
+latter.
+"""
+
+import importlib.util
+import shutil
+import tempfile
+import unittest
+import warnings
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from typing import Any
+
+from lxml import etree
+from xsdata.exceptions import ConverterError, ConverterWarning, ParserError
+from xsdata.formats.dataclass.parsers import XmlParser
+
+import colour_cxf.cxf3
+from colour_cxf import read_cxf, read_cxf_from_file
+from colour_cxf._fast_parse import FastParserError, parse_cxf
+from colour_cxf.tests import RESOURCES_DIRECTORY
+from colour_cxf.tests.test_generic_parsing import CXF_FILES
+from colour_cxf.tests.test_invalid_cxf_parsing import (
+    INVALID_DOCUMENTS,
+    read_invalid_document,
+)
+
+PATH_GENERATE_FAST_PARSER = (
+    Path(__file__).parents[2] / "utilities" / "generate_fast_parser.py"
+)
+
+DOCUMENT_HEADER = b"""<?xml version="1.0" encoding="UTF-8"?>
+<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core" \
+xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" \
+xmlns:xs="http://www.w3.org/2001/XMLSchema">
+"""
+
+
+def parse_generic(document: bytes) -> colour_cxf.cxf3.CxF:
+    """Parse given document with the generic *xsdata* parser."""
+
+    return XmlParser().from_bytes(document, colour_cxf.cxf3.CxF)
+
+
+def ignore_converter_warnings(test_method: Callable) -> Callable:
+    """
+    Ignore the warnings the generic parser emits for the values it cannot convert
+    while running given test method.
+    """
+
+    @wraps(test_method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConverterWarning)
+            return test_method(*args, **kwargs)
+
+    return wrapper
+
+
+class FastParserParity(unittest.TestCase):
+    """
+    Define tests comparing the fast parser with the generic *xsdata* parser over
+    the edge case and invalid CxF documents.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self.documents = {
+            name: (RESOURCES_DIRECTORY / name).read_bytes() for name in CXF_FILES
+        }
+        self.documents.update(
+            (name, read_invalid_document(name)) for name in INVALID_DOCUMENTS
+        )
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+
+    def assert_generic_parity(
+        self, document: bytes, validate_schema: bool = False
+    ) -> None:
+        """
+        Assert that reading given document from bytes and from a file produces
+        the same result, or raises the same error, as the generic *xsdata* parser.
+        """
+
+        file_path = Path(self.temporary_directory.name) / "document.cxf"
+        file_path.write_bytes(document)
+
+        try:
+            expected = parse_generic(document)
+        except ParserError as error:
+            with self.assertRaises(ParserError) as context:
+                read_cxf(document, validate_schema=validate_schema)
+
+            self.assertEqual(str(context.exception), str(error))
+
+            with self.assertRaises(ParserError) as context:
+                read_cxf_from_file(file_path, validate_schema=validate_schema)
+
+            self.assertEqual(str(context.exception), str(error))
+        else:
+            self.assertEqual(
+                read_cxf(document, validate_schema=validate_schema), expected
+            )
+            self.assertEqual(
+                read_cxf_from_file(file_path, validate_schema=validate_schema),
+                expected,
+            )
+
+    @ignore_converter_warnings
+    def test_parse_cxf(self) -> None:
+        """
+        Test that the fast parser produces the same objects as the generic parser,
+        unless it raises one of the errors falling back to the latter.
+        """
+
+        parser = etree.XMLParser(recover=True, remove_comments=True)
+        for name, document in self.documents.items():
+            with self.subTest(name=name):
+                tree = etree.fromstring(document, parser)
+
+                try:
+                    result = parse_cxf(tree)
+                except (FastParserError, ConverterError, ValueError):
+                    # Only the invalid documents may require the generic parser.
+                    self.assertIn(name, INVALID_DOCUMENTS)
+                    continue
+
+                self.assertEqual(result, parse_generic(document))
+
+    @ignore_converter_warnings
+    def test_read_cxf_without_validation(self) -> None:
+        """
+        Test that reading the documents without validating the schema matches the
+        generic parser, whichever parser actually produced the results.
+        """
+
+        for name, document in self.documents.items():
+            with self.subTest(name=name):
+                self.assert_generic_parity(document)
+
+    def test_fallback_fast_parser_error(self) -> None:
+        """Test the fallback for the elements unknown to the fast parser."""
+
+        document = (
+            DOCUMENT_HEADER
+            + b"""<cc:FileInformation>
+    <cc:Creator>Colour Developers</cc:Creator>
+    <cc:UnknownElement>Unknown</cc:UnknownElement>
+</cc:FileInformation>
+</cc:CxF>"""
+        )
+
+        with self.assertRaises(FastParserError):
+            parse_cxf(etree.fromstring(document))
+
+        self.assert_generic_parity(document)
+
+    def test_fallback_xsi_attributes(self) -> None:
+        """Test the fallback for the documents using *xsi* attributes."""
+
+        document = (
+            DOCUMENT_HEADER
+            + b"""<cc:FileInformation>
+    <cc:Creator xsi:type="xs:string">Colour Developers</cc:Creator>
+</cc:FileInformation>
+</cc:CxF>"""
+        )
+
+        with self.assertRaises(FastParserError):
+            parse_cxf(etree.fromstring(document))
+
+        self.assert_generic_parity(document, validate_schema=True)
+        self.assert_generic_parity(document)
+
+    @ignore_converter_warnings
+    def test_fallback_converter_error(self) -> None:
+        """Test the fallback for the values that cannot be converted."""
+
+        document = (
+            DOCUMENT_HEADER
+            + b"""<cc:FileInformation>
+    <cc:CreationDate>Yesterday</cc:CreationDate>
+</cc:FileInformation>
+</cc:CxF>"""
+        )
+
+        with self.assertRaises(ConverterError):
+            parse_cxf(etree.fromstring(document))
+
+        self.assert_generic_parity(document)
+
+    @ignore_converter_warnings
+    def test_fallback_value_error(self) -> None:
+        """Test the fallback for the numbers that cannot be converted."""
+
+        document = (
+            DOCUMENT_HEADER
+            + b"""<cc:Resources>
+    <cc:ObjectCollection>
+        <cc:Object ObjectType="Target" Name="Test" Id="1">
+            <cc:ColorValues>
+                <cc:ColorSRGB>
+                    <cc:R>Red</cc:R>
+                    <cc:G>128</cc:G>
+                    <cc:B>64</cc:B>
+                </cc:ColorSRGB>
+            </cc:ColorValues>
+        </cc:Object>
+    </cc:ObjectCollection>
+</cc:Resources>
+</cc:CxF>"""
+        )
+
+        with self.assertRaises(ValueError):
+            parse_cxf(etree.fromstring(document))
+
+        self.assert_generic_parity(document)
+
+    def test_fallback_generic_element_tail(self) -> None:
+        """
+        Test the fallback for the elements delegated to the generic parser that
+        are followed by text.
+        """
+
+        document = (
+            DOCUMENT_HEADER
+            + b"""<cc:CustomResources>
+    <custom:Data xmlns:custom="http://example.com/custom" Value="1"/>
+</cc:CustomResources>Text
+</cc:CxF>"""
+        )
+
+        with self.assertRaises(FastParserError):
+            parse_cxf(etree.fromstring(document))
+
+        self.assert_generic_parity(document)
+        self.assertIsInstance(
+            read_cxf(document, validate_schema=False).custom_resources,
+            colour_cxf.cxf3.CustomResources,
+        )
+
+    def test_fallback_processing_instructions(self) -> None:
+        """
+        Test the fallback for the text split by processing instructions, which
+        the generic parser truncates.
+        """
+
+        document = (
+            DOCUMENT_HEADER
+            + b"""<cc:FileInformation>
+    <cc:Creator>Colour<?processing instruction?> Developers</cc:Creator>
+</cc:FileInformation>
+</cc:CxF>"""
+        )
+
+        with self.assertRaises(FastParserError):
+            parse_cxf(etree.fromstring(document))
+
+        self.assert_generic_parity(document, validate_schema=True)
+        self.assert_generic_parity(document)
+
+    def test_fallback_empty_file(self) -> None:
+        """
+        Test the fallback to reading the file contents when it cannot be memory
+        mapped.
+        """
+
+        self.assert_generic_parity(b"")
+
+
+@unittest.skipUnless(
+    PATH_GENERATE_FAST_PARSER.exists() and shutil.which("ruff"),
+    'The "generate_fast_parser.py" utility and "ruff" are required!',
+)
+class FastParserGeneration(unittest.TestCase):
+    """
+    Define tests ensuring that the :mod:`colour_cxf._fast_parse` module is in sync
+    with its generator.
+    """
+
+    def test_render_fast_parser(self) -> None:
+        """
+        Test that rendering the fast parser reproduces the
+        :mod:`colour_cxf._fast_parse` module exactly.
+        """
+
+        specification = importlib.util.spec_from_file_location(
+            "generate_fast_parser", PATH_GENERATE_FAST_PARSER
+        )
+        assert specification is not None
+        assert specification.loader is not None
+        generate_fast_parser = importlib.util.module_from_spec(specification)
+        specification.loader.exec_module(generate_fast_parser)
+
+        module_path = Path(colour_cxf.__file__).parent / "_fast_parse.py"
+
+        self.assertEqual(
+            generate_fast_parser.render_fast_parser(str(module_path)).encode(),
+            module_path.read_bytes(),
+        )
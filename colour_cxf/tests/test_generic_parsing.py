@@ -7,13 +7,30 @@ These tests verify basic parsing functionality, roundtrip operations, and
 performance across all test files without specific validation logic.
 """
 
+import mmap
+import tempfile
 import unittest
 from pathlib import Path
 
+from lxml import etree
 from lxml_asserts.testcase import LxmlTestCaseMixin
+from xsdata.formats.dataclass.serializers import XmlSerializer
 
 import colour_cxf.cxf3
-from colour_cxf import read_cxf, read_cxf_from_file, write_cxf
+from colour_cxf import (
+    read_cxf,
+    read_cxf_from_file,
+    read_cxf_many,
+    write_cxf,
+    write_cxf_to_file,
+)
+from colour_cxf._fast_parse import OBJECT_TAG, parse_cxf, parse_cxf_events
+from colour_cxf._serialize import CxFSerializer
+from colour_cxf.tests import RESOURCES_DIRECTORY
+from colour_cxf.tests.test_extended_samples import EDGE_CASE_FILES
+
+# CxF documents to run the generic tests over
+CXF_FILES = (*EDGE_CASE_FILES, "sample.cxf")
 
 
 class GenericCxfParsing(unittest.TestCase, LxmlTestCaseMixin):
@@ -22,69 +39,112 @@ class GenericCxfParsing(unittest.TestCase, LxmlTestCaseMixin):
     provided in the :mod:`colour_cxf` module.
     """
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.resources_dir = Path(__file__).parent / "resources"
-
-        # Collect all XML files for testing
-        self.all_cxf_files = []
-
-        # Sample files
-        case_files = [
-            "minimal_cxf.cxf",
-            "empty_sections.cxf",
-            "fileinformation_all_optional.cxf",
-            "datetime_edge_cases.cxf",
-            "string_edge_cases.cxf",
-            "enumeration_boundary_values.cxf",
-            "object_required_only.cxf",
-            "multiple_objects.cxf",
-            "custom_resources.cxf",
-            "spectral_data_boundaries.cxf",
-            "custom_spectrum_irregular.cxf",
-            "id_reference_validation.cxf",
-            "unicode_special_characters.cxf",
-            "geometry_edge_cases.cxf",
-            "sample.cxf",
-        ]
-
-        # Combine all files for generic testing
-        self.all_cxf_files = case_files
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test fixtures shared by the test methods."""
+        cls.resources_dir = RESOURCES_DIRECTORY
+
+        cls.all_cxf_files = CXF_FILES
+
+        # Resolve, read and parse each file once, the test methods share the results
+        cls.file_paths = {
+            filename: cls.resources_dir / filename for filename in cls.all_cxf_files
+        }
+        cls.file_bytes = {
+            filename: file_path.read_bytes()
+            for filename, file_path in cls.file_paths.items()
+        }
+        cls.parsed_cxf = {
+            filename: read_cxf(doc) for filename, doc in cls.file_bytes.items()
+        }
 
     def test_all_files_parsing_success(self) -> None:
         """Test that all CxF documents can be successfully parsed."""
 
         for filename in self.all_cxf_files:
-            file_path = self.resources_dir / filename
-            cxf = read_cxf_from_file(file_path)
-            self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
+            self.assertIsInstance(self.parsed_cxf[filename], colour_cxf.cxf3.CxF)
 
     def test_all_files_roundtrip(self) -> None:
         """Test that all CxF documents can be parsed and written back."""
         for filename in self.all_cxf_files:
-            file_path = self.resources_dir / filename
-
             with self.subTest(filename=filename):
-                # Parse the file
-                cxf = read_cxf_from_file(file_path)
-                self.assertIsInstance(cxf, colour_cxf.cxf3.CxF)
+                cxf = self.parsed_cxf[filename]
 
-                # Write it back and parse again
+                # Write it back and parse again, validating the written document
                 xml_bytes = write_cxf(cxf)
                 cxf_roundtrip = read_cxf(xml_bytes)
                 self.assertEqual(cxf, cxf_roundtrip)
 
+    def test_writing_methods_consistency(self) -> None:
+        """Test that write_cxf_to_file and write_cxf produce the same bytes."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            for filename in self.all_cxf_files:
+                target_path = Path(temporary_directory) / filename
+
+                with self.subTest(filename=filename):
+                    cxf = self.parsed_cxf[filename]
+                    write_cxf_to_file(cxf, target_path)
+
+                    self.assertEqual(target_path.read_bytes(), write_cxf(cxf))
+
+    def test_serializer_consistency(self) -> None:
+        """Test that the spectral values fast path matches the xsdata serializer."""
+        serializer = CxFSerializer()
+        serializer_generic = XmlSerializer()
+        for values in (
+            [0.1, 0.25, 1.0, 2.5],
+            [1e-05, 0.5, 1e16],
+            [0.5, float("inf"), float("-inf"), float("nan")],
+            [0.5, 1],
+            [],
+        ):
+            with self.subTest(values=values):
+                spectrum = colour_cxf.cxf3.ReflectanceSpectrum(value=values)
+
+                self.assertEqual(
+                    serializer.render(spectrum), serializer_generic.render(spectrum)
+                )
+
     def test_parsing_methods_consistency(self) -> None:
         """Test that read_cxf_from_file and read_cxf produce consistent results."""
-        for filename in self.all_cxf_files:
-            file_path = self.resources_dir / filename
-
+        for filename, file_path in self.file_paths.items():
             with self.subTest(filename=filename):
-                # Test both parsing methods
                 cxf_from_file = read_cxf_from_file(file_path)
 
-                with open(file_path, "rb") as f:
-                    cxf_from_bytes = read_cxf(f.read())
+                with (
+                    open(file_path, "rb") as f,
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+                ):
+                    cxf_from_buffer = read_cxf(buffer)
+
+                # Verify all methods return the same data
+                self.assertEqual(self.parsed_cxf[filename], cxf_from_file)
+                self.assertEqual(self.parsed_cxf[filename], cxf_from_buffer)
 
-                # Verify both methods return the same data
-                self.assertEqual(cxf_from_bytes, cxf_from_file)
+    def test_parallel_parsing_consistency(self) -> None:
+        """Test that read_cxf_many matches read_cxf_from_file per file."""
+        file_paths = list(self.file_paths.values())
+
+        cxfs = read_cxf_many(file_paths, max_workers=2, chunksize=4)
+
+        self.assertEqual(cxfs, [read_cxf_from_file(path) for path in file_paths])
+
+    def test_streaming_parser_consistency(self) -> None:
+        """Test that the incremental parser matches the generated parser."""
+        for filename, file_path in self.file_paths.items():
+            with self.subTest(filename=filename):
+                cxf_events = parse_cxf_events(
+                    etree.iterparse(
+                        file_path,
+                        events=("end",),
+                        tag=OBJECT_TAG,
+                        remove_comments=True,
+                    )
+                )
+                cxf_tree = parse_cxf(
+                    etree.parse(
+                        file_path, etree.XMLParser(remove_comments=True)
+                    ).getroot()
+                )
+
+                self.assertEqual(cxf_events, cxf_tree)
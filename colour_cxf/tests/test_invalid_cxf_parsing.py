@@ -9,11 +9,90 @@ proper error detection and handling of:
 """
 
 import unittest
+from unittest import mock
 
+from lxml import etree
 from lxml_asserts.testcase import LxmlTestCaseMixin
 from xsdata.exceptions import ParserError
 
-from colour_cxf import read_cxf
+from colour_cxf import read_cxf, read_cxf_from_file
+from colour_cxf.tests import RESOURCES_DIRECTORY
+
+RESOURCES_DIRECTORY_INVALID = RESOURCES_DIRECTORY / "invalid"
+
+
+def read_invalid_document(name: str) -> bytes:
+    """Read the invalid CxF document with given name from the test resources."""
+
+    return (RESOURCES_DIRECTORY_INVALID / f"{name}.cxf").read_bytes()
+
+
+INVALID_DOCUMENTS = (
+    # Malformed XML structure, i.e., an unclosed tag
+    "malformed_xml_structure",
+    # Invalid root element
+    "invalid_root_element",
+    # Missing namespace declaration
+    "missing_namespace",
+    # Wrong namespace
+    "wrong_namespace",
+    # Resources placed before FileInformation (wrong order according to schema)
+    "invalid_element_structure",
+    # Unknown elements
+    "unknown_elements",
+    # Object without required Id attribute
+    "missing_required_attributes",
+    # Invalid ASTM table enumeration value
+    "invalid_astm_table_enum",
+    # Invalid sphere type enumeration value
+    "invalid_sphere_type_enum",
+    # Invalid device class enumeration value
+    "invalid_device_class_enum",
+    # RGB values outside valid range
+    "out_of_range_rgb_values",
+    # CMYK values outside valid range
+    "out_of_range_cmyk_values",
+    # Invalid datetime format
+    "invalid_datetime_format",
+    # Duplicate object IDs
+    "duplicate_object_ids",
+    # Invalid ColorSpecification reference
+    "invalid_color_specification_reference",
+    # Invalid spectral wavelength range
+    "invalid_spectral_wavelength_range",
+    # Negative spectral increment
+    "negative_spectral_increment",
+    # Invalid characters in XML
+    "invalid_xml_encoding",
+    # Empty required fields
+    "empty_required_fields",
+)
+
+# Expected beginning of the error message, including the error location, of
+# invalid documents
+INVALID_DOCUMENT_MESSAGES = {
+    "malformed_xml_structure": (
+        "XML is not well-formed: Opening and ending tag mismatch: Object line 5 "
+        "and ObjectCollection, line 6, column 31 (<string>, line 6)"
+    ),
+    "invalid_xml_encoding": (
+        "XML is not well-formed: Invalid character: Char 0x0 out of allowed range"
+    ),
+    "invalid_root_element": (
+        "Schema validation failed: <string>:2:0:ERROR:SCHEMASV:SCHEMAV_CVC_ELT_1: "
+        "Element '{http://colorexchangeformat.com/CxF3-core}InvalidRoot'"
+    ),
+    "unknown_elements": (
+        "Schema validation failed: <string>:4:0:ERROR:SCHEMASV:"
+        "SCHEMAV_ELEMENT_CONTENT: "
+        "Element '{http://colorexchangeformat.com/CxF3-core}UnknownElement'"
+    ),
+    "invalid_astm_table_enum": (
+        "Schema validation failed: <string>:8:0:ERROR:SCHEMASV:"
+        "SCHEMAV_CVC_ENUMERATION_VALID: "
+        "Element '{http://colorexchangeformat.com/CxF3-core}Observer'"
+    ),
+}
 
 
 class InvalidCxfParsing(unittest.TestCase, LxmlTestCaseMixin):
@@ -21,362 +100,84 @@ class InvalidCxfParsing(unittest.TestCase, LxmlTestCaseMixin):
     Test parsing of invalid CxF documents to verify error detection.
     """
 
-    def test_malformed_xml_structure(self) -> None:
-        """Test that malformed XML structure is properly detected."""
-
-        # Test unclosed tag
-        unclosed_tag_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(unclosed_tag_xml)
-
-    def test_invalid_root_element(self) -> None:
-        """Test that invalid root element is detected."""
-
-        invalid_root_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:InvalidRoot xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-    </cc:Resources>
-</cc:InvalidRoot>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_root_xml)
-
-    def test_missing_namespace(self) -> None:
-        """Test that missing namespace declaration is detected."""
-
-        missing_namespace_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<CxF>
-    <Resources>
-    </Resources>
-</CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(missing_namespace_xml)
-
-    def test_wrong_namespace(self) -> None:
-        """Test that wrong namespace is detected."""
-
-        wrong_namespace_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://wrong-namespace.com/CxF3-core">
-    <cc:Resources>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(wrong_namespace_xml)
-
-    def test_invalid_element_structure(self) -> None:
-        """Test that invalid element structure is detected."""
-
-        # Resources placed before FileInformation (wrong order according to schema)
-        wrong_order_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-    </cc:Resources>
-    <cc:FileInformation>
-        <cc:Creator>Test</cc:Creator>
-    </cc:FileInformation>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(wrong_order_xml)
-
-    def test_unknown_elements(self) -> None:
-        """Test that unknown elements are detected."""
-
-        unknown_element_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:UnknownElement>Invalid</cc:UnknownElement>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(unknown_element_xml)
-
-    def test_missing_required_attributes(self) -> None:
-        """Test that missing required attributes are detected."""
-
-        # Object without required Id attribute
-        missing_id_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test">
-                <cc:ColorValues>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(missing_id_xml)
-
-    def test_invalid_astm_table_enum(self) -> None:
-        """Test that invalid ASTM table enumeration values are detected."""
-
-        invalid_astm_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ColorSpecificationCollection>
-            <cc:ColorSpecification Id="spec1">
-                <cc:TristimulusSpec>
-                    <cc:Illuminant>D65</cc:Illuminant>
-                    <cc:Observer>10</cc:Observer>
-                    <cc:AstmTable>InvalidTable</cc:AstmTable>
-                </cc:TristimulusSpec>
-            </cc:ColorSpecification>
-        </cc:ColorSpecificationCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_astm_xml)
-
-    def test_invalid_sphere_type_enum(self) -> None:
-        """Test that invalid sphere type enumeration values are detected."""
-
-        invalid_sphere_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-                <cc:ColorValues>
-                    <cc:ReflectanceSpectrum>
-                        <cc:MeasurementSpec>
-                            <cc:SphereType>InvalidSphere</cc:SphereType>
-                        </cc:MeasurementSpec>
-                    </cc:ReflectanceSpectrum>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_sphere_xml)
-
-    def test_invalid_device_class_enum(self) -> None:
-        """Test that invalid device class enumeration values are detected."""
-
-        invalid_device_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-                <cc:DeviceColorValues>
-                    <cc:ColorCMYK>
-                        <cc:C>50.0</cc:C>
-                        <cc:M>25.0</cc:M>
-                        <cc:Y>75.0</cc:Y>
-                        <cc:K>10.0</cc:K>
-                        <cc:DeviceClass>InvalidDevice</cc:DeviceClass>
-                    </cc:ColorCMYK>
-                </cc:DeviceColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_device_xml)
-
-    def test_out_of_range_rgb_values(self) -> None:
-        """Test that RGB values outside valid range are detected."""
-
-        invalid_rgb_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-                <cc:ColorValues>
-                    <cc:ColorSRGB>
-                        <cc:R>300</cc:R>
-                        <cc:G>128</cc:G>
-                        <cc:B>-50</cc:B>
-                    </cc:ColorSRGB>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_rgb_xml)
-
-    def test_out_of_range_cmyk_values(self) -> None:
-        """Test that CMYK values outside valid range are detected."""
-
-        invalid_cmyk_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-                <cc:DeviceColorValues>
-                    <cc:ColorCMYK>
-                        <cc:C>150.0</cc:C>
-                        <cc:M>25.0</cc:M>
-                        <cc:Y>75.0</cc:Y>
-                        <cc:K>-10.0</cc:K>
-                    </cc:ColorCMYK>
-                </cc:DeviceColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_cmyk_xml)
-
-    def test_invalid_datetime_format(self) -> None:
-        """Test that invalid datetime format is detected."""
-
-        invalid_datetime_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:FileInformation>
-        <cc:CreationDate>not-a-valid-datetime</cc:CreationDate>
-    </cc:FileInformation>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_datetime_xml)
-
-    def test_duplicate_object_ids(self) -> None:
-        """Test that duplicate object IDs are detected."""
-
-        duplicate_id_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test1" Id="duplicate">
-                <cc:ColorValues>
-                </cc:ColorValues>
-            </cc:Object>
-            <cc:Object ObjectType="Target" Name="Test2" Id="duplicate">
-                <cc:ColorValues>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(duplicate_id_xml)
-
-    def test_invalid_color_specification_reference(self) -> None:
-        """Test that invalid ColorSpecification references are detected."""
-
-        invalid_ref_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-                <cc:ColorValues>
-                    <cc:ColorCIELab ColorSpecification="NonExistentSpec">
-                        <cc:L>50.0</cc:L>
-                        <cc:A>10.0</cc:A>
-                        <cc:B>-5.0</cc:B>
-                    </cc:ColorCIELab>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-        <cc:ColorSpecificationCollection>
-            <cc:ColorSpecification Id="ExistingSpec">
-                <cc:TristimulusSpec>
-                    <cc:Illuminant>D65</cc:Illuminant>
-                    <cc:Observer>2</cc:Observer>
-                </cc:TristimulusSpec>
-            </cc:ColorSpecification>
-        </cc:ColorSpecificationCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_ref_xml)
-
-    def test_invalid_spectral_wavelength_range(self) -> None:
-        """Test that invalid spectral wavelength ranges are detected."""
-
-        invalid_spectrum_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-                <cc:ColorValues>
-                    <cc:ReflectanceSpectrum StartWL="-100" EndWL="50000" Increment="10">
-                        <cc:Value>0.5 0.6 0.7</cc:Value>
-                    </cc:ReflectanceSpectrum>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_spectrum_xml)
-
-    def test_negative_spectral_increment(self) -> None:
-        """Test that negative spectral increment is detected."""
-
-        negative_increment_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="Test" Id="1">
-                <cc:ColorValues>
-                    <cc:ReflectanceSpectrum StartWL="400" EndWL="700" Increment="-10">
-                        <cc:Value>0.5 0.6 0.7</cc:Value>
-                    </cc:ReflectanceSpectrum>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(negative_increment_xml)
-
-    def test_invalid_xml_encoding(self) -> None:
-        """Test that invalid XML encoding is detected."""
-
-        # Invalid characters in XML
-        invalid_encoding_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:FileInformation>
-        <cc:Creator>\x00InvalidChar</cc:Creator>
-    </cc:FileInformation>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(invalid_encoding_xml)
-
-    def test_empty_required_fields(self) -> None:
-        """Test that empty required fields are detected."""
-
-        empty_name_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
-<cc:CxF xmlns:cc="http://colorexchangeformat.com/CxF3-core">
-    <cc:Resources>
-        <cc:ObjectCollection>
-            <cc:Object ObjectType="Target" Name="" Id="1">
-                <cc:ColorValues>
-                </cc:ColorValues>
-            </cc:Object>
-        </cc:ObjectCollection>
-    </cc:Resources>
-</cc:CxF>"""
-
-        with self.assertRaises(ParserError):
-            read_cxf(empty_name_xml)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    def test_invalid_documents(self) -> None:
+        """Test that invalid CxF documents are properly detected."""
+
+        for name in INVALID_DOCUMENTS:
+            with self.subTest(name=name), self.assertRaises(ParserError):
+                read_cxf(read_invalid_document(name))
+
+    def test_invalid_documents_from_file(self) -> None:
+        """
+        Test that reading invalid CxF documents from files raises the same
+        errors as reading them from bytes.
+        """
+
+        for name in INVALID_DOCUMENTS:
+            with self.subTest(name=name):
+                with self.assertRaises(ParserError) as context_bytes:
+                    read_cxf(read_invalid_document(name))
+
+                with self.assertRaises(ParserError) as context_file:
+                    read_cxf_from_file(RESOURCES_DIRECTORY_INVALID / f"{name}.cxf")
+
+                self.assertIs(
+                    type(context_file.exception), type(context_bytes.exception)
+                )
+                self.assertEqual(
+                    str(context_file.exception), str(context_bytes.exception)
+                )
+
+    def test_invalid_document_messages(self) -> None:
+        """
+        Test that the error messages distinguish between not well-formed and
+        schema invalid documents and locate the errors.
+        """
+
+        for name, message in INVALID_DOCUMENT_MESSAGES.items():
+            with self.subTest(name=name):
+                with self.assertRaises(ParserError) as context:
+                    read_cxf(read_invalid_document(name))
+
+                self.assertTrue(
+                    str(context.exception).startswith(message),
+                    str(context.exception),
+                )
+
+    def test_empty_document_without_validation(self) -> None:
+        """
+        Test that an empty document that *lxml* cannot recover from raises the
+        generic parser error when the schema is not validated.
+        """
+
+        with self.assertRaises(ParserError):
+            read_cxf(b"", validate_schema=False)
+
+    def test_schema_loading_errors(self) -> None:
+        """
+        Test that the errors raised while loading the schema are reported as
+        parser errors whichever way the document is read.
+        """
+
+        document = RESOURCES_DIRECTORY / "minimal_cxf.cxf"
+        for error in (
+            FileNotFoundError("CxF3_Core.xsd"),
+            etree.XMLSchemaParseError("Invalid schema"),
+        ):
+            with (
+                self.subTest(error=error),
+                mock.patch("colour_cxf._get_schema", side_effect=error),
+            ):
+                with self.assertRaises(ParserError) as context:
+                    read_cxf(document.read_bytes())
+
+                self.assertEqual(
+                    str(context.exception), f"Schema validation error: {error}"
+                )
+
+                with self.assertRaises(ParserError) as context:
+                    read_cxf_from_file(document)
+
+                self.assertEqual(
+                    str(context.exception), f"Schema validation error: {error}"
+                )
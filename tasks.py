@@ -554,7 +554,8 @@ def generate_cxf3_code(ctx: Context, target: str) -> None:
     """
     Generate the code for reading/writing CxF files.
 
-    The output source files will be generated in the `colour_cxf.cxf3` folder.
+    The output source files will be generated in the `colour_cxf.cxf3` folder,
+    and the `colour_cxf._fast_parse` module regenerated from them.
 
     Parameters
     ----------
@@ -574,5 +575,10 @@ def generate_cxf3_code(ctx: Context, target: str) -> None:
         f"--wrapper-fields "
         f"--unnest-classes "
         f"--compound-fields "
+        f"--slots "
         f"{target}"
     )
+
+    message_box('Generating "colour_cxf._fast_parse" module...')
+    with ctx.cd("utilities"):
+        ctx.run("./generate_fast_parser.py")
@@ -0,0 +1,604 @@
+#!/usr/bin/env python
+"""
+Generate Fast Parser
+====================
+
+Generate the :mod:`colour_cxf._fast_parse` module from the *xsdata* binding
+metadata of the :mod:`colour_cxf.cxf3` data classes.
+
+Each data class reachable from :class:`colour_cxf.cxf3.CxF` gets a dedicated
+``_parse_<ClassName>`` function with hard-coded element tags, attribute names
+and type coercions, walking the :mod:`lxml` tree directly instead of going
+through the generic *xsdata* node machinery.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import re
+import subprocess
+import sys
+from enum import Enum
+from typing import TYPE_CHECKING
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers.utils import ParserUtils
+
+import colour_cxf.cxf3
+
+if TYPE_CHECKING:
+    from xsdata.formats.dataclass.models.elements import XmlMeta, XmlVar
+
+__copyright__ = "Copyright 2024 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "INTERNED_ATTRIBUTES",
+    "PATH_MODULE_FAST_PARSE",
+    "collect_classes",
+    "generate_fast_parser",
+    "render_fast_parser",
+]
+
+PATH_MODULE_FAST_PARSE = os.path.join(
+    os.path.dirname(__file__), "..", "colour_cxf", "_fast_parse.py"
+)
+
+INTERNED_ATTRIBUTES: frozenset[str] = frozenset(
+    [
+        "ColorSpecification",
+        "Label",
+        "Method",
+        "Notation",
+        "ObjectType",
+        "ProfileSpecification",
+        "StandardRef",
+        "Units",
+    ]
+)
+"""
+Attributes whose string values are passed through :func:`sys.intern`: their
+values are repeated across the thousands of objects of a large *CxF* file and
+interning them shares a single string instance.
+"""
+
+HEADER = '''"""
+Fast Parser
+===========
+
+Define *lxml* based parsing functions for the :mod:`colour_cxf.cxf3` data
+classes.
+
+This module was generated by ``utilities/generate_fast_parser.py``, it must
+not be edited manually.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from lxml import etree
+from xsdata.formats.converter import converter
+from xsdata.models.datatype import XmlDateTime
+
+from colour_cxf import _get_parser
+from colour_cxf.cxf3 import (
+{imports}
+)
+
+__all__ = [
+    "FastParserError",
+    "OBJECT_TAG",
+    "parse_cxf",
+    "parse_cxf_events",
+]
+
+
+class FastParserError(Exception):
+    """
+    Raise when a document requires the generic *xsdata* parser.
+    """
+
+
+_XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+
+_XSI_ATTRIBUTES = etree.XPath(
+    "descendant-or-self::*/@xsi:type | descendant-or-self::*/@xsi:nil",
+    namespaces={{"xsi": _XSI_NAMESPACE}},
+)
+
+
+
+def _parse_generic(elem: etree._Element, clazz: type) -> object:
+    """
+    Parse given element with the generic *xsdata* parser, sharing its context
+    with the :mod:`colour_cxf` module.
+
+    The generic parser binds the text following the element, i.e., its tail,
+    in place of the element when it is not whitespace, such documents are left
+    to the generic parser as a whole.
+    """
+
+    if elem.tail is not None and elem.tail.strip():
+        raise FastParserError(elem.tag)
+
+    return _get_parser().parse(elem, clazz, {{}})
+
+
+{types}
+'''
+
+FOOTER = '''
+
+def parse_cxf(root: etree._Element) -> CxF:
+    """
+    Parse given *CxF* root element into a :class:`colour_cxf.cxf3.CxF` instance.
+
+    Parameters
+    ----------
+    root
+        Root element of the *CxF* document.
+
+    Returns
+    -------
+    :class:`colour_cxf.cxf3.CxF`
+        Parsed *CxF* document.
+
+    Raises
+    ------
+    FastParserError
+        If the document uses constructs that only the generic *xsdata* parser
+        supports, e.g., unknown elements or type substitutions.
+    """
+
+    if root.tag != "{tag}" or _XSI_ATTRIBUTES(root):
+        raise FastParserError(root.tag)
+
+    return _parse_CxF(root)
+
+
+OBJECT_TAG = "{object_tag}"
+"""
+Tag of the *CxF* objects, the :func:`lxml.etree.iterparse` events given to
+:func:`parse_cxf_events` must be filtered with it.
+"""
+
+
+def parse_cxf_events(events: etree.iterparse) -> CxF:
+    """
+    Parse given *CxF* incremental parsing events into a
+    :class:`colour_cxf.cxf3.CxF` instance.
+
+    Each object is bound as soon as its end event is received and its element
+    is then discarded, thus the whole document tree is never held in memory.
+
+    Parameters
+    ----------
+    events
+        :func:`lxml.etree.iterparse` iterator yielding the *end* events of the
+        :attr:`OBJECT_TAG` elements.
+
+    Returns
+    -------
+    :class:`colour_cxf.cxf3.CxF`
+        Parsed *CxF* document.
+
+    Raises
+    ------
+    FastParserError
+        If the document uses constructs that only the generic *xsdata* parser
+        supports, e.g., unknown elements or type substitutions.
+    """
+
+    objects = []
+    collection = None
+    for _event, elem in events:
+        parent = elem.getparent()
+        if collection is None:
+            collection = parent
+
+        if parent is None or parent is not collection or _XSI_ATTRIBUTES(elem):
+            raise FastParserError(elem.tag)
+
+        objects.append(_parse_Object(elem))
+
+        # The previous objects have been bound, their elements can be safely
+        # deleted while parsing.
+        elem.clear()
+        while (previous := elem.getprevious()) is not None:
+            if previous.tag != OBJECT_TAG:
+                raise FastParserError(previous.tag)
+
+            parent.remove(previous)
+
+    root = events.root
+    if root is None:
+        raise FastParserError(None)
+
+    if collection is not None:
+        resources = collection.getparent()
+        if (
+            collection.tag != "{collection_tag}"
+            or resources is None
+            or resources.tag != "{resources_tag}"
+            or resources.getparent() is not root
+        ):
+            raise FastParserError(collection.tag)
+
+        for elem in collection.findall(OBJECT_TAG):
+            collection.remove(elem)
+
+    cxf = parse_cxf(root)
+    if objects and cxf.resources is not None:
+        object_collection = cxf.resources.object_collection
+        if object_collection is not None:
+            object_collection.object_value = objects
+
+    return cxf
+'''
+
+
+def collect_classes(context: XmlContext, root: type) -> dict[type, XmlMeta]:
+    """
+    Collect the data classes reachable from given root class.
+
+    Parameters
+    ----------
+    context
+        *xsdata* context used to build the binding metadata.
+    root
+        Root data class.
+
+    Returns
+    -------
+    dict
+        Binding metadata of the reachable classes.
+    """
+
+    classes: dict[type, XmlMeta] = {}
+    stack = [root]
+    while stack:
+        clazz = stack.pop()
+        if clazz in classes:
+            continue
+
+        meta = classes[clazz] = context.build(clazz)
+        for var in meta.get_all_vars():
+            for choice in [var, *var.elements.values()]:
+                stack.extend(
+                    type_ for type_ in choice.types if dataclasses.is_dataclass(type_)
+                )
+
+    return dict(sorted(classes.items(), key=lambda item: item[0].__name__))
+
+
+def _is_supported(meta: XmlMeta) -> bool:
+    """Return whether the class can be parsed by a generated function."""
+
+    if meta.mixed_content or meta.wildcards or meta.any_attributes:
+        return False
+
+    for var in meta.get_all_vars():
+        if var.is_clazz_union or not var.init:
+            return False
+
+        for choice in var.elements.values():
+            if choice.tokens:
+                return False
+
+    return True
+
+
+class _Generator:
+    """Accumulate the generated source code."""
+
+    def __init__(self) -> None:
+        self.types: dict[tuple, str] = {}
+        self.choices: dict[tuple, str] = {}
+
+    def types_constant(self, var: XmlVar) -> str:
+        """Return the constant name holding the types of given var."""
+
+        key = tuple(var.types)
+        if key not in self.types:
+            self.types[key] = f"_TYPES_{len(self.types)}"
+
+        return self.types[key]
+
+    def choices_constant(self, var: XmlVar) -> str:
+        """
+        Return the constant name holding the tag to parsing function mapping
+        of given compound var.
+        """
+
+        key = tuple(
+            (qname, choice.clazz.__name__)  # type: ignore[union-attr]
+            for qname, choice in var.elements.items()
+        )
+        if key not in self.choices:
+            self.choices[key] = f"_CHOICES_{len(self.choices)}"
+
+        return self.choices[key]
+
+    def convert(self, var: XmlVar, value: str) -> str:
+        """Return the expression converting given value for given var."""
+
+        types = var.types
+        if len(types) == 1 and types[0] in (str, float, int):
+            type_ = types[0]
+            if type_ is str:
+                return value
+
+            return f"{type_.__name__}({value})"
+
+        format_ = f', format="{var.format}"' if var.format else ""
+
+        return f"converter.deserialize({value}, {self.types_constant(var)}{format_})"
+
+    def convert_text(self, var: XmlVar, value: str) -> str:
+        """Return the expression converting given element text for given var."""
+
+        if var.tokens:
+            types = var.types
+            if len(types) == 1 and types[0] in (float, int):
+                # Spectral values are decoded in a single "map" call rather than
+                # a per-token comprehension.
+                return f"list(map({types[0].__name__}, {value}.split()))"
+
+            return f"[{self.convert(var, 'token')} for token in {value}.split()]"
+
+        return self.convert(var, value)
+
+    def text_default(self, var: XmlVar) -> str:
+        """Return the literal used by *xsdata* for an element without text."""
+
+        default = ParserUtils.parse_value(
+            value=None,
+            types=var.types,
+            default=var.default,
+            tokens_factory=var.tokens_factory,
+            format=var.format,
+        )
+        if default is None and not var.nillable:
+            default = b"" if bytes in var.types else ""
+
+        if isinstance(default, Enum):
+            return f"{type(default).__name__}.{default.name}"
+
+        if isinstance(default, str):
+            return '"{}"'.format(default.replace("\\", "\\\\").replace('"', '\\"'))
+
+        return repr(default)
+
+    def child_value(self, var: XmlVar) -> list[str]:
+        """Return the statements computing the value of given child var."""
+
+        if var.clazz is not None:
+            return [f"value = _parse_{var.clazz.__name__}(child)"]
+
+        return [
+            "if len(child):",
+            "    raise FastParserError(tag)",
+            "text = child.text",
+            (
+                f"value = {self.text_default(var)} if text is None "
+                f"else {self.convert_text(var, 'text')}"
+            ),
+        ]
+
+    @staticmethod
+    def bind_value(var: XmlVar) -> list[str]:
+        """Return the statements binding the child value to given var."""
+
+        if var.list_element:
+            return [
+                f'values = params.get("{var.name}")',
+                "if values is None:",
+                f'    params["{var.name}"] = [value]',
+                "else:",
+                "    values.append(value)",
+            ]
+
+        return [
+            f'if "{var.name}" in params:',
+            "    raise FastParserError(tag)",
+            f'params["{var.name}"] = value',
+        ]
+
+    def function(self, clazz: type, meta: XmlMeta) -> list[str]:
+        """Return the source code of the parsing function for given class."""
+
+        name = clazz.__name__
+        lines = [
+            f"def _parse_{name}(elem: etree._Element) -> {name}:",
+            f'    """Parse given element into :class:`{name}`."""',
+            "",
+        ]
+
+        if not _is_supported(meta):
+            lines.append(f"    return _parse_generic(elem, {name})  # type: ignore")
+            return lines
+
+        lines.append("    params = {}")
+
+        attributes = list(meta.attributes.values())
+        if attributes:
+            lines.append("    attrib = elem.attrib")
+            for var in attributes:
+                value = self.convert(var, "value")
+                if var.qname in INTERNED_ATTRIBUTES and value == "value":
+                    value = "sys.intern(value)"
+
+                lines.extend(
+                    [
+                        f'    value = attrib.get("{var.qname}")',
+                        "    if value is not None:",
+                        f'        params["{var.name}"] = {value}',
+                    ]
+                )
+
+        branches = []
+        for var in meta.get_element_vars():
+            if var.is_element:
+                branches.append(
+                    (
+                        f'tag == "{var.qname}"',
+                        [*self.child_value(var), *self.bind_value(var)],
+                    )
+                )
+            elif var.is_elements and all(
+                choice.clazz is not None for choice in var.elements.values()
+            ):
+                # Compound fields of data classes, e.g., "ColorValues", dispatch
+                # the child through a single mapping lookup rather than testing
+                # each of the choices in turn.
+                branches.append(
+                    (
+                        f"(parse := {self.choices_constant(var)}.get(tag)) is not None",
+                        ["value = parse(child)", *self.bind_value(var)],
+                    )
+                )
+            elif var.is_elements:
+                branches.extend(
+                    (
+                        f'tag == "{qname}"',
+                        [*self.child_value(choice), *self.bind_value(var)],
+                    )
+                    for qname, choice in var.elements.items()
+                )
+
+        if branches:
+            lines.extend(
+                ["    for child in elem.iterchildren():", "        tag = child.tag"]
+            )
+            for index, (condition, statements) in enumerate(branches):
+                keyword = "if" if index == 0 else "elif"
+                lines.append(f"        {keyword} {condition}:")
+                lines.extend(f"            {line}" for line in statements)
+            lines.extend(["        else:", "            raise FastParserError(tag)"])
+        else:
+            lines.extend(
+                [
+                    "    if len(elem):",
+                    "        raise FastParserError(elem[0].tag)",
+                ]
+            )
+
+        if meta.text is not None:
+            var = meta.text
+            lines.extend(
+                [
+                    "    text = elem.text",
+                    "    if text is not None:",
+                    f'        params["{var.name}"] = {self.convert_text(var, "text")}',
+                ]
+            )
+
+        lines.append(f"    return {name}(**params)")
+
+        return lines
+
+
+def render_fast_parser(path: str = PATH_MODULE_FAST_PARSE) -> str:
+    """
+    Render the :mod:`colour_cxf._fast_parse` module source formatted with
+    *ruff*.
+
+    Parameters
+    ----------
+    path
+        Path to the generated module, used by *ruff* to resolve its settings.
+
+    Returns
+    -------
+    :class:`str`
+        Module source.
+    """
+
+    context = XmlContext()
+    classes = collect_classes(context, colour_cxf.cxf3.CxF)
+    generator = _Generator()
+
+    functions = [
+        "\n".join(generator.function(clazz, meta)) for clazz, meta in classes.items()
+    ]
+
+    def type_name(type_: type) -> str:
+        return type_.__name__ if type_.__module__ != "builtins" else type_.__qualname__
+
+    types = "\n".join(
+        f"{constant} = ({', '.join(type_name(type_) for type_ in key)},)"
+        for key, constant in generator.types.items()
+    )
+
+    body = types + "\n".join(functions)
+    imports = [
+        name
+        for name in sorted(dir(colour_cxf.cxf3))
+        if isinstance(getattr(colour_cxf.cxf3, name), type)
+        and re.search(rf"(?<![}}\w]){name}\b", body)
+    ]
+
+    header = HEADER.format(
+        imports="\n".join(f"    {name}," for name in imports),
+        types=types,
+    )
+
+    choices = "\n\n".join(
+        f"{constant} = {{\n"
+        + "".join(f'    "{qname}": _parse_{name},\n' for qname, name in key)
+        + "}"
+        for key, constant in generator.choices.items()
+    )
+
+    content = header + "\n\n" + "\n\n\n".join(functions) + "\n"
+    if choices:
+        content += "\n\n" + choices + "\n"
+
+    def child_qname(clazz: type, child: type) -> str:
+        return next(
+            var.qname for var in classes[clazz].get_element_vars() if var.clazz is child
+        )
+
+    content += FOOTER.format(
+        tag=classes[colour_cxf.cxf3.CxF].qname,
+        object_tag=child_qname(
+            colour_cxf.cxf3.ObjectCollection, colour_cxf.cxf3.Object
+        ),
+        collection_tag=child_qname(
+            colour_cxf.cxf3.Resources, colour_cxf.cxf3.ObjectCollection
+        ),
+        resources_tag=child_qname(colour_cxf.cxf3.CxF, colour_cxf.cxf3.Resources),
+    )
+
+    return subprocess.run(  # noqa: S603
+        ["ruff", "format", "--stdin-filename", path, "-"],  # noqa: S607
+        input=content,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+
+def generate_fast_parser(path: str = PATH_MODULE_FAST_PARSE) -> None:
+    """
+    Generate the :mod:`colour_cxf._fast_parse` module.
+
+    Parameters
+    ----------
+    path
+        Path to the generated module.
+    """
+
+    with open(path, "w") as module_file:
+        module_file.write(render_fast_parser(path))
+
+
+if __name__ == "__main__":
+    generate_fast_parser()